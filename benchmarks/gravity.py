@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Compare the grid approximation of gravity fields with the direct sum.
+
+Random bodies, spread uniformly or in clusters, are attracted by each other
+with every pair computed and with the grid approximation, the relative error
+of the approximated accelerations and the time of both are printed for each
+cell size.
+
+Usage:
+
+    python3 benchmarks/gravity.py [--bodies N] [--side N] [--max-error N]
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+import pymunk
+
+sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
+
+# pylint: disable=wrong-import-position
+from src.simulation.gravityfield import GravityField
+
+CELL_SIZES = (300, 1000, 3000)
+
+def createBodies(count, side, clustered, seed):
+
+    rand = random.Random(seed)
+
+    if clustered:
+        centers = [(rand.uniform(0, side), rand.uniform(0, side))
+                   for _ in range(8)]
+    else:
+        centers = None
+
+    bodies = []
+    for _ in range(count):
+        body = pymunk.Body(rand.uniform(1, 10), 1)
+
+        if centers is None:
+            body.position = rand.uniform(0, side), rand.uniform(0, side)
+        else:
+            center_x, center_y = rand.choice(centers)
+            body.position = (rand.gauss(center_x, side/40),
+                             rand.gauss(center_y, side/40))
+
+        bodies.append(body)
+
+    return bodies
+
+def accelerations(bodies, **kwargs):
+
+    field = GravityField(bodies, n_body=True, **kwargs)
+
+    start = time.perf_counter()
+    field.update()
+
+    return field.accelerations, time.perf_counter() - start
+
+def relativeErrors(approximated, exact):
+
+    errors = []
+    for (acc_x, acc_y), (exact_x, exact_y) in zip(approximated, exact):
+        exact_norm = (exact_x**2 + exact_y**2)**0.5
+        if exact_norm > 0:
+            errors.append(((acc_x - exact_x)**2 +
+                           (acc_y - exact_y)**2)**0.5/exact_norm)
+
+    return sorted(errors)
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--bodies', type=int, default=1000)
+    parser.add_argument('--side', type=float, default=10000)
+    parser.add_argument('--max-error', type=float, default=0.1,
+                        help='fail if any median error is above this')
+    args = parser.parse_args()
+
+    failed = False
+    for clustered in (False, True):
+        bodies = createBodies(args.bodies, args.side, clustered, seed=0)
+        exact, direct_time = accelerations(bodies,
+                                           direct_limit=args.bodies)
+
+        layout = 'clustered' if clustered else 'uniform'
+        print(f'{layout}: direct {1000*direct_time:.1f}ms')
+
+        for cell_size in CELL_SIZES:
+            approximated, grid_time = accelerations(
+                bodies, cell_size=cell_size, direct_limit=0)
+            errors = relativeErrors(approximated, exact)
+
+            median = errors[len(errors)//2]
+            percentile_90 = errors[9*len(errors)//10]
+            failed = failed or median > args.max_error
+
+            print(f'  cell size {cell_size}: {1000*grid_time:.1f}ms, '
+                  f'median error {median:.4f}, 90th percentile '
+                  f'{percentile_90:.4f}')
+
+    if failed:
+        sys.exit('The grid approximation is not accurate enough')
+
+if __name__ == '__main__':
+    main()
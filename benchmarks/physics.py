@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""Measure the physics step time of crowded scenarios.
+
+A box full of moving circles is stepped with each physics engine
+configuration that can be set in the [PhysicsEngine] section of a scenario,
+the configurations are the same used by scenario files.
+
+Usage:
+
+    python3 benchmarks/physics.py [--objects N] [--steps N]
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+import pymunk
+
+sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
+
+# pylint: disable=wrong-import-position
+from src.storage.loaders.scenarioloader import loadPhysicsEngine
+from src.simulation.physicsengine import createSpace
+
+CONFIGS = {
+
+    'default': {},
+    'threaded': {'threads': 2},
+    'spatial-hash': {'SpatialHash': {'dimension': 20, 'count': 10000}},
+    'threaded-spatial-hash': {
+        'threads': 2, 'SpatialHash': {'dimension': 20, 'count': 10000}},
+    'sleeping': {'sleep_time_threshold': 0.5, 'idle_speed_threshold': 5}
+}
+
+RADIUS = 5
+
+def populate(space, objects, seed):
+
+    rand = random.Random(seed)
+
+    # About a third of the box is covered by circles
+    side = (3*objects*(2*RADIUS)**2)**0.5
+
+    walls = [pymunk.Segment(space.static_body, start, end, 1) for start, end in
+             (((0, 0), (side, 0)), ((side, 0), (side, side)),
+              ((side, side), (0, side)), ((0, side), (0, 0)))]
+    space.add(*walls)
+
+    for _ in range(objects):
+        body = pymunk.Body(1, pymunk.moment_for_circle(1, 0, RADIUS))
+        body.position = (rand.uniform(RADIUS, side - RADIUS),
+                         rand.uniform(RADIUS, side - RADIUS))
+        body.velocity = (rand.uniform(-50, 50), rand.uniform(-50, 50))
+
+        shape = pymunk.Circle(body, RADIUS)
+        shape.elasticity = 0.5
+        shape.friction = 0.5
+
+        space.add(body, shape)
+
+def measure(engine_content, objects, steps, step_time):
+
+    space = createSpace(loadPhysicsEngine(engine_content))
+    populate(space, objects, seed=0)
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        space.step(step_time)
+
+    return (time.perf_counter() - start)/steps
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--objects', type=int, default=5000)
+    parser.add_argument('--steps', type=int, default=200)
+    parser.add_argument('--step-time', type=float, default=0.02)
+    args = parser.parse_args()
+
+    baseline = None
+    for name, engine_content in CONFIGS.items():
+        step = measure(engine_content, args.objects, args.steps,
+                       args.step_time)
+
+        if baseline is None:
+            baseline = step
+
+        print(f'{name}: {1000*step:.2f}ms per step '
+              f'({baseline/step:.2f}x default)')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""Measure the cold start time of the application.
+
+Every measurement runs in a new python process started in the base folder of
+this project, so nothing is cached by the interpreter between runs.
+
+Usage:
+
+    python3 benchmarks/startup.py [--runs N]
+"""
+
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+BASE_PATH = Path(__file__).parent.parent.resolve()
+
+CASES = {
+
+    # Import of the GUI entry point, it includes loading the forms
+    'gui-import': 'import src.main',
+
+    # Paths used without the GUI
+    'fileinfo-import': 'import src.storage.fileinfo',
+    'scenario-load': (
+        'from src.storage.fileinfo import FileInfo\n'
+        "FileInfo().loadScenario('examples/scenario1')"
+    )
+}
+
+def measure(code, runs):
+
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=str(BASE_PATH),
+                       check=True)
+        times.append(time.perf_counter() - start)
+
+    return times
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    baseline = statistics.median(measure('pass', args.runs))
+    print(f'interpreter: {1000*baseline:.1f}ms (median of {args.runs})')
+
+    for name, code in CASES.items():
+        times = measure(code, args.runs)
+        median = statistics.median(times)
+        print(f'{name}: {1000*median:.1f}ms '
+              f'(+{1000*(median - baseline):.1f}ms over interpreter, '
+              f'min {1000*min(times):.1f}ms)')
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,11 @@
 #!/usr/bin/env python
 
 import os
-from setuptools import setup, find_namespace_packages
+from setuptools import setup, find_namespace_packages, Command
 from setuptools.command.install import install
+from setuptools.command.build_py import build_py
 from pathlib import Path
+from xml.etree import ElementTree
 
 DIR_PATH = Path(__file__).parent.resolve()
 
@@ -17,6 +19,7 @@ PACKAGE_BASE_NAME = 'spaceship_control'
 SOURCE_PATH = 'src'
 EXTRA_PACKAGES = ('examples.ships', 'examples.scenarios', 'examples.images',
                   'examples.controllers', 'examples.objects',
+                  'examples.objectfields',
                   'examples.controllers.lib', 'forms')
 
 packages = [PACKAGE_BASE_NAME]
@@ -25,6 +28,41 @@ packages.extend(add_package_prefix(find_namespace_packages(where=SOURCE_PATH),
 
 packages.extend(add_package_prefix(EXTRA_PACKAGES, PACKAGE_BASE_NAME))
 
+class CompileForms(Command):
+    """Compile the Qt Designer forms into python modules.
+
+    Each 'forms/<name>.ui' is compiled into 'forms/<name>_ui.py', that is
+    loaded at runtime instead of compiling the form on every start.
+    """
+
+    description = 'compile forms/*.ui files into python modules'
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        from PyQt5 import uic
+
+        for ui_path in DIR_PATH.joinpath('forms').glob('*.ui'):
+            compiled_path = ui_path.with_name(f'{ui_path.stem}_ui.py')
+
+            base_class_name = ElementTree.parse(str(ui_path)).getroot().find(
+                'widget').get('class')
+
+            with open(compiled_path, 'w') as file:
+                uic.compileUi(str(ui_path), file)
+                file.write(f'\nBASE_CLASS_NAME = {base_class_name!r}\n')
+
+class OverrideBuildPy(build_py):
+
+    def run(self):
+        self.run_command('compile_forms')
+        super().run()
+
 class OverrideInstall(install):
 
     def run(self):
@@ -64,6 +102,7 @@ setup(
         'spaceship_control.examples.objects':
             ['*.toml', '*.json', '*.yml', '*.yaml'],
         'spaceship_control.examples.images': ['*.png'],
+        'spaceship_control.examples.objectfields': ['*.csv', '*.npy'],
         'spaceship_control.examples.controllers': ['*.py'],
         'spaceship_control.examples.controllers.lib': ['*.py']
     },
@@ -71,13 +110,22 @@ setup(
 
         'gui_scripts': [
             'spaceshipcontrol = spaceship_control.main:main',
+        ],
+
+        'console_scripts': [
+            'spaceshipcontrol-compile-scenario = '
+            'spaceship_control.compilescenario:main',
         ]
     },
     data_files = [
         ('share/applications', [TEMP_DESKTOP_FILE]),
         ('share/icons', ['imgs/spaceshipcontrol.png'])
     ],
-    cmdclass={'install': OverrideInstall},
+    cmdclass={
+        'install': OverrideInstall,
+        'build_py': OverrideBuildPy,
+        'compile_forms': CompileForms
+    },
     license='LGPL-3.0'
 )
 
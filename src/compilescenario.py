@@ -0,0 +1,26 @@
+import sys
+import argparse
+
+from .storage.fileinfo import FileInfo
+
+def main():
+
+    parser = argparse.ArgumentParser(
+        description='Compile scenarios into bundles that load faster.')
+    parser.add_argument('scenarios', nargs='+', metavar='scenario',
+                        help='name of the scenario, e.g. examples/scenario1')
+    args = parser.parse_args()
+
+    fileinfo = FileInfo()
+
+    for scenario in args.scenarios:
+        try:
+            bundle_path = fileinfo.compileScenario(scenario)
+        except Exception as err: # pylint: disable=broad-except
+            print(f'{scenario}: {err}', file=sys.stderr)
+            sys.exit(1)
+
+        print(f'{scenario}: {bundle_path}')
+
+if __name__ == '__main__':
+    main()
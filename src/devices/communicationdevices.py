@@ -6,7 +6,7 @@ import math
 
 from pymunk import Vec2d
 
-from .device import DefaultDevice
+from .device import DefaultDevice, noActions
 
 class CommunicationEngine:
 
@@ -20,6 +20,11 @@ class CommunicationEngine:
         def position(self):
             pass
 
+        @property
+        def body(self):
+            """Body the receiver moves with, if any."""
+            return None
+
     class _Signal:
 
         def __init__(self, start_point, initial_intensity, frequency, engine):
@@ -48,8 +53,8 @@ class CommunicationEngine:
             self.__cur_distance += self.__engine._speed # pylint: disable=protected-access
             self.__calcDist()
 
-        def sendTo(self, receiver):
-            dist = Vec2d(receiver.position).get_dist_sqrd(self.__start)
+        def sendTo(self, receiver, position):
+            dist = position.get_dist_sqrd(self.__start)
 
             if self.__sqrd_min_distance < dist < self.__sqrd_max_distance:
                 noise = (random.random() - 0.5)*self.__engine._noise_max # pylint: disable=protected-access
@@ -72,17 +77,42 @@ class CommunicationEngine:
 
         self.__signals = []
         self.__receivers = []
+        self.__receiver_positions = {}
+
+    def __receiversWithPositions(self):
+
+        # The positions of receivers in sleeping bodies don't change, so they
+        # are only queried again once the body wakes up
+        positions = self.__receiver_positions
+
+        receivers = []
+        for receiver in self.__receivers:
+            body = receiver.body
+            position = positions.get(receiver)
+
+            if position is None or body is None or not body.is_sleeping:
+                position = Vec2d(receiver.position)
+                positions[receiver] = position
+
+            receivers.append((receiver, position))
+
+        return receivers
 
     def step(self):
 
-        invalid_signals_indexes = []
         signals = self.__signals
+        if not signals:
+            return
+
+        receivers = self.__receiversWithPositions()
+
+        invalid_signals_indexes = []
         for i, signal in enumerate(signals):
             if not signal.isValid():
                 invalid_signals_indexes.append(i)
                 continue
-            for receiver in self.__receivers:
-                signal.sendTo(receiver)
+            for receiver, position in receivers:
+                signal.sendTo(receiver, position)
             signal.step()
 
         if invalid_signals_indexes:
@@ -100,6 +130,7 @@ class CommunicationEngine:
 
     def clear(self):
         self.__receivers.clear()
+        self.__receiver_positions.clear()
         self.__signals.clear()
 
 class BasicReceiver(DefaultDevice, CommunicationEngine.Receiver):
@@ -119,6 +150,7 @@ class BasicReceiver(DefaultDevice, CommunicationEngine.Receiver):
         if engine is not None:
             engine.addReceiver(self)
 
+    @noActions
     def act(self):
         pass
 
@@ -126,6 +158,10 @@ class BasicReceiver(DefaultDevice, CommunicationEngine.Receiver):
     def position(self):
         return self.__part.position
 
+    @property
+    def body(self):
+        return self.__part.body
+
     def signalReceived(self, intensity, frequency):
 
         frequency_diff = abs(frequency - self._frequency)
@@ -198,6 +234,7 @@ class BasicSender(DefaultDevice):
         self._frequency = frequency
         self._intensity = intensity
 
+    @noActions
     def act(self):
         pass
 
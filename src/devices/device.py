@@ -9,6 +9,16 @@ import shlex
 
 from abc import ABC, abstractmethod
 
+def noActions(act: 'Callable[[Device], None]') \
+    -> 'Callable[[Device], None]':
+    """Decorator that marks an `act` method that does nothing.
+
+    Device groups don't call `act` on devices whose class has a marked `act`,
+    subclasses that override it are called again.
+    """
+    act.has_actions = False
+    return act
+
 class Device(ABC):
     """Base class for all devices.
 
@@ -62,6 +72,11 @@ class Device(ABC):
 
         """
 
+    @property
+    def has_actions(self) -> bool:
+        """False if the `act` of the device class was marked by `noActions`."""
+        return getattr(type(self).act, 'has_actions', True)
+
     @property
     def mirror(self) -> 'Device.Mirror':
         return Device.Mirror(self)
@@ -366,6 +381,14 @@ class DeviceGroup(DefaultDevice):
         self.__device_list: 'List[Device]' = []
         self.__device_dict: 'Dict[str, Device]' = {}
 
+        # Changed every time a device is added to this group or to one of
+        # its subgroups, so only the schedules that include it are rebuilt
+        self.__tree_version = 0
+        self.__parents: 'List[DeviceGroup]' = []
+
+        self.__schedule: 'Tuple[Device, ...]' = ()
+        self.__schedule_version = None
+
         self.setInfo('is-device-group', 'yes')
 
     def addDevice(self, device: Device, name: str = None):
@@ -389,6 +412,17 @@ class DeviceGroup(DefaultDevice):
             if isinstance(device, DefaultDevice):
                 device.setInfo('device-name-in-group', name)
 
+        if isinstance(device, DeviceGroup):
+            device.__parents.append(self)
+
+        self.__treeChanged()
+
+    def __treeChanged(self) -> None:
+
+        self.__tree_version += 1
+        for parent in self.__parents:
+            parent.__treeChanged()
+
     def deviceCount(self) -> int:
         """Method used to get the device count.
 
@@ -416,13 +450,40 @@ class DeviceGroup(DefaultDevice):
 
         return device
 
+    def actingDevices(self) -> 'Tuple[Device, ...]':
+        """Method used to get the subdevices whose `act` must be called.
+
+        The subdevices of groups that don't override `act` are included
+        directly, so the devices tree is not walked every time, and devices
+        that have no actions are left out. The list is only built again after
+        a device is added to this group or to one of its subgroups.
+
+        Returns:
+            Subdevices, in the order they are called by `act`.
+        """
+
+        if self.__schedule_version != self.__tree_version:
+            schedule = []
+            for device in self.__device_list:
+                if isinstance(device, DeviceGroup) and \
+                    type(device).act is DeviceGroup.act:
+
+                    schedule.extend(device.actingDevices())
+                elif device.has_actions:
+                    schedule.append(device)
+
+            self.__schedule = tuple(schedule)
+            self.__schedule_version = self.__tree_version
+
+        return self.__schedule
+
     def act(self) -> None:
         """Method `act` is overriden so it will call `act` for all subdevices.
 
         This method override `act` of `Device` and is implemented to call `act`
-        for all subdevices.
+        for all subdevices that have actions, see `actingDevices`.
         """
-        for device in self.__device_list:
+        for device in self.actingDevices():
             device.act()
 
     def communicate(self, input_: str) -> str:
@@ -68,6 +68,11 @@ class Engine(Actuator):
 
     def actuate(self) -> None:
 
+        # Engines without thrust and without thrust error don't apply any
+        # force, the others still apply the error
+        if self.__thrust == 0 and self.__thrust_error is None:
+            return
+
         if self.__thrust_error is None:
             thrust = self.__thrust
         else:
@@ -76,7 +81,7 @@ class Engine(Actuator):
         if self.__angle_error is None:
             angle = self.__angle
         else:
-            angle = self.__angle_error(self.__angle_error)
+            angle = self.__angle_error(self.__angle)
 
         if self.__pos_error is None:
             x = y = 0
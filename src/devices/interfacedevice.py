@@ -5,7 +5,7 @@ from PyQt5.QtGui import QFontMetricsF, QFont
 from PyQt5.QtWidgets import QLabel, QTextEdit
 from PyQt5.QtCore import Qt
 
-from .device import DefaultDevice
+from .device import DefaultDevice, noActions
 
 from ..utils.actionqueue import ActionQueue, Action
 
@@ -19,7 +19,13 @@ class InterfaceDevice(DefaultDevice):
 
         self.__queue = ActionQueue()
 
+    @noActions
     def act(self) -> None:
+        # Widgets may only be modified in the GUI thread, so the actions are
+        # processed by `processActions` instead
+        pass
+
+    def processActions(self) -> None:
         self.__queue.processItems()
 
     def addAction(self, action: 'Action') -> None:
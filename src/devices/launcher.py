@@ -0,0 +1,86 @@
+from math import cos, sin, inf
+
+from .structure import Actuator
+
+class Launcher(Actuator):
+    """Actuator that launches objects from its structural part.
+
+    The `launch` command only requests a launch, the object is spawned by
+    `act`, in the simulation thread, once the launcher is reloaded. Objects are
+    launched with the velocity of the structure plus `speed` in the direction
+    of the launcher.
+    """
+
+    def __init__(self, part: 'StructuralPart', object_model: str,
+                 speed: 'Union[float, int]' = 0,
+                 angle: 'Union[float, int]' = 0,
+                 reload_time: 'Union[float, int]' = 0,
+                 lifetime: 'Optional[Union[float, int]]' = None) -> None:
+        super().__init__(part)
+
+        self.__object_model = object_model
+        self.__speed = speed
+        self.__angle = angle
+        self.__reload_time = reload_time
+        self.__lifetime = lifetime
+
+        self.__launch_requested = False
+        self.__last_launch_time = -inf
+
+    @property
+    def object_model(self) -> str:
+        return self.__object_model
+
+    @property
+    def reload_time(self) -> 'Union[float, int]':
+        return self.__reload_time
+
+    @property
+    def speed(self) -> 'Union[float, int]':
+        return self.__speed
+
+    def launch(self) -> str:
+        self.__launch_requested = True
+        return '<<OK>>'
+
+    def actuate(self) -> None:
+
+        if self.__launch_requested is False:
+            return
+
+        part = self.structural_part
+        structure = part.structure
+        spawner = None if structure is None else structure.spawner
+
+        if spawner is None:
+            self.__launch_requested = False
+            return
+
+        if spawner.time - self.__last_launch_time < self.__reload_time:
+            return
+
+        self.__launch_requested = False
+
+        x, y = part.position
+        angle = part.angle + self.__angle
+        velocity_x, velocity_y = part.velocity
+
+        handle = spawner.spawn(
+            self.__object_model, (x, y, angle),
+            velocity=(velocity_x + self.__speed*cos(angle),
+                      velocity_y + self.__speed*sin(angle)),
+            lifetime=self.__lifetime)
+
+        if handle is not None:
+            self.__last_launch_time = spawner.time
+
+    def command(self, command: 'List[str]', *args) -> 'Any':
+        return super().command(command, Launcher.__COMMANDS, *args)
+
+    __COMMANDS = {
+
+        'launch': launch,
+        'get-object-model': object_model.fget,
+        'get-reload-time': reload_time.fget,
+        'get-speed': speed.fget
+    }
@@ -6,10 +6,14 @@ import math
 
 from pymunk import Vec2d
 
-from .device import DeviceGroup, DefaultDevice
+from .device import DeviceGroup, DefaultDevice, noActions
 
 from ..utils.errorgenerator import ErrorGenerator
 
+# Thrusts were impulses applied every 0.02 seconds step, they are now forces
+# that give the same impulse over this time
+THRUST_TIME_UNIT = 0.02
+
 class Structure(DeviceGroup):
 
     def __init__(self, name: str, space: 'pymunk.Space', body: 'pymunk.Body',
@@ -23,6 +27,15 @@ class Structure(DeviceGroup):
         self.__body = body
         self.__space = space
         self.__name = name
+        self.__spawner = None
+
+        self.__force_x = 0
+        self.__force_y = 0
+        self.__torque = 0
+        self.__has_force = False
+
+        # Net force of the current step, in body coordinates, and its torque
+        self.__step_force = None
 
     @property
     def name(self) -> str:
@@ -34,6 +47,52 @@ class Structure(DeviceGroup):
         if isinstance(device, StructuralPart):
             device.structure = self
 
+    def addForce(self, force_x: float, force_y: float,
+                 point: 'Tuple[float, float]') -> None:
+        """Add a force, in body coordinates, applied at a body point.
+
+        The forces are added up and applied to the body at once by `act`,
+        and again by `applyStepForce` in each substep.
+        """
+
+        cog = self.__body.center_of_gravity
+        self.__force_x += force_x
+        self.__force_y += force_y
+        self.__torque += (point[0] - cog.x)*force_y - (point[1] - cog.y)*force_x
+        self.__has_force = True
+
+    def act(self) -> None:
+        super().act()
+
+        if self.__has_force is False:
+            self.__step_force = None
+            return
+
+        self.__step_force = (self.__force_x, self.__force_y, self.__torque)
+
+        self.__force_x = self.__force_y = self.__torque = 0
+        self.__has_force = False
+
+        self.applyStepForce()
+
+    def applyStepForce(self) -> None:
+        """Apply to the body the forces added up by the last `act`.
+
+        The physics engine resets the forces of the bodies in every step, so
+        this is called before each substep after the first. Nothing is done
+        when no force was added, so resting bodies are not woken up.
+        """
+
+        if self.__step_force is None:
+            return
+
+        force_x, force_y, torque = self.__step_force
+
+        body = self.__body
+        body.apply_force_at_local_point((force_x, force_y),
+                                        body.center_of_gravity)
+        body.torque += torque
+
     def isDestroyed(self) -> bool:
         return self.__body.space is None
 
@@ -45,6 +104,14 @@ class Structure(DeviceGroup):
     def space(self) -> 'pymunk.Space':
         return self.__space
 
+    @property
+    def spawner(self) -> 'Optional[ObjectSpawner]':
+        return self.__spawner
+
+    @spawner.setter
+    def spawner(self, spawner: 'Optional[ObjectSpawner]') -> None:
+        self.__spawner = spawner
+
 class StructuralPart(DeviceGroup):
 
     def __init__(self,
@@ -65,11 +132,13 @@ class StructuralPart(DeviceGroup):
         if self.__structure is None:
             return
 
-        body = self.__structure.body
-        body_angle = body.angle
-
-        body.apply_impulse_at_local_point((math.cos(angle)*val,
-                                           math.sin(angle)*val), self.__offset)
+        # The force is integrated by the physics engine over the whole step,
+        # so the thrust doesn't depend on the step time
+        force = val/THRUST_TIME_UNIT
+        offset_x, offset_y = self.__offset
+        self.__structure.addForce(math.cos(angle)*force,
+                                  math.sin(angle)*force,
+                                  (offset_x + x, offset_y + y))
 
     @property
     def position(self) -> 'Tuple[float, float]':
@@ -90,6 +159,12 @@ class StructuralPart(DeviceGroup):
             return self.__offset
         return tuple(self.__structure.body.velocity)
 
+    @property
+    def body(self) -> 'Optional[pymunk.Body]':
+        if self.__structure is None:
+            return None
+        return self.__structure.body
+
     @property
     def structure(self) -> Structure:
         return self.__structure
@@ -133,6 +208,7 @@ class Sensor(DefaultDevice):
     def max_read_offset(self) -> 'Union[float, int]':
         return self.__error_gen.max_offset
 
+    @noActions
     def act(self) -> None:
         pass
 
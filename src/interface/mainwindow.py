@@ -4,6 +4,7 @@ import json
 import time
 from math import pi
 from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from queue import Empty as EmptyQueueException
 
@@ -14,9 +15,9 @@ except ImportError:
 
 from PyQt5.QtWidgets import (
     QMainWindow, QGraphicsScene, QFileDialog, QMessageBox, QGraphicsPixmapItem,
-    QTextBrowser, QGraphicsItemGroup
+    QTextBrowser, QGraphicsItemGroup, QGraphicsView
 )
-from PyQt5.QtGui import QPixmap, QTransform
+from PyQt5.QtGui import QTransform
 from PyQt5.QtCore import QTimer, Qt
 
 import pymunk
@@ -26,6 +27,8 @@ import anytree
 # pylint: disable=relative-beyond-top-level
 
 from .objectgraphicsitem import ObjectGraphicsItem
+from .simulationscene import SimulationScene
+from .swarmgraphicsitem import SwarmGraphicsItem
 from .choosefromtreedialog import ChooseFromTreeDialog
 from .conditiongraphicspixmapitem import ConditionGraphicsPixmapItem
 
@@ -33,6 +36,13 @@ from ..storage.fileinfo import FileInfo
 
 from ..objectives.objective import createObjectiveTree
 
+from ..simulation.simulationthread import SimulationThread
+from ..simulation.physicsengine import applyCollisionMatrix
+from ..simulation.substepscheduler import SubstepScheduler
+from ..simulation.worldchunks import WorldChunks
+from ..simulation.objectspawner import ObjectSpawner, ObjectEmitter
+from ..simulation.scenarioworld import buildScenarioWorld
+
 # pylint: enable=relative-beyond-top-level
 
 # sys.path manipulation used to import nodetreeview.py from ui
@@ -63,7 +73,7 @@ class MainWindow(QMainWindow):
         self.__ui = UiMainWindow()
         self.__ui.setupUi(self)
 
-        self.__ui.view.setScene(QGraphicsScene(parent))
+        self.__ui.view.setScene(SimulationScene(parent))
 
         self.__lock = Lock()
 
@@ -81,6 +91,18 @@ class MainWindow(QMainWindow):
         self.__scenario_objectives = []
         self.__objectives_complete = False
         self.__current_scenario = None
+        self.__cull_offscreen = False
+        self.__batch_ships = False
+        self.__batch_objects = False
+        self.__swarm_items = {}
+        self.__spawned_items = []
+        self.__interface_devices = []
+        self.__simulation = None
+        self.__last_simulation_state = None
+        self.__culled_objects = set()
+        self.__loading = None
+        self.__loading_progress = None
+        self.__loading_executor = ThreadPoolExecutor(max_workers=1)
 
         self.__widgets = []
         self.__objectives_node_value = []
@@ -141,7 +163,12 @@ class MainWindow(QMainWindow):
 
     def __updateTitle(self):
 
-        if self.__current_scenario is None:
+        if self.__loading is not None:
+            scenario, _ = self.__loading
+            finished, total = self.__loading_progress
+            self.setWindowTitle(f'{self.__title_basename}(loading {scenario} '
+                                f'{finished}/{total})')
+        elif self.__current_scenario is None:
             self.setWindowTitle(self.__title_basename)
         else:
             if not self.__scenario_objectives:
@@ -155,6 +182,8 @@ class MainWindow(QMainWindow):
                 f'{self.__title_basename}({self.__current_scenario}){suffix}')
 
     def closeEvent(self, _event):
+        self.__loading = None
+        self.__loading_executor.shutdown(wait=False)
         self.clear()
         self.__ui.view.setScene(None)
 
@@ -166,6 +195,12 @@ class MainWindow(QMainWindow):
         self.__ui.deviceInterfaceComponents.show()
         self.__ui.treeView.show()
 
+        if self.__simulation is not None:
+            self.__simulation.stop()
+            self.__simulation.join()
+            self.__simulation = None
+            self.__last_simulation_state = None
+
         with self.__lock:
             self.__space.remove(*self.__space.bodies, *self.__space.shapes)
 
@@ -177,8 +212,14 @@ class MainWindow(QMainWindow):
             for item in scene.items():
                 scene.removeItem(item)
 
+            scene.clearBackground()
+
             self.__ships.clear()
             self.__objects.clear()
+            self.__culled_objects.clear()
+            self.__swarm_items.clear()
+            self.__spawned_items.clear()
+            self.__interface_devices.clear()
             self.__condition_graphic_items.clear()
 
         self.__current_scenario = None
@@ -219,8 +260,8 @@ class MainWindow(QMainWindow):
 
     def __loadGraphicItemImagePart(self, image, condition_variables):
 
-        pixmap = QPixmap(FileInfo().getPath(FileInfo.FileDataType.IMAGE,
-                                            image.name))
+        fileinfo = FileInfo()
+        pixmap = fileinfo.loadPixmap(image.name)
 
         image_x_is_expr = isinstance(image.x, str)
         image_y_is_expr = isinstance(image.y, str)
@@ -230,7 +271,7 @@ class MainWindow(QMainWindow):
             pixmap.width(), pixmap.height(), image.width, image.height)
 
         if not image_angle_is_expr:
-            pixmap = pixmap.transformed(QTransform().rotate(image.angle))
+            pixmap = fileinfo.loadPixmap(image.name, angle=image.angle)
 
         if image_angle_is_expr or image_x_is_expr or image_y_is_expr or \
             image.condition:
@@ -280,6 +321,37 @@ class MainWindow(QMainWindow):
 
         return gitem
 
+    @staticmethod
+    def __canBatchImages(images):
+
+        return not any(image.condition or isinstance(image.x, str) or
+                       isinstance(image.y, str) or isinstance(image.angle, str)
+                       for image in images)
+
+    def __loadShipGraphicItem(self, ship, ship_model, ship_variables, images):
+
+        if self.__batch_ships is False or not self.__canBatchImages(images):
+            ship_gitem = self.__loadGraphicItem(
+                ship.body.shapes, images,
+                condition_variables={'ship': ship.mirror})
+
+            self.__ui.view.scene().addItem(ship_gitem)
+
+            return ship_gitem
+
+        # Ships of the same model may look different if they use different
+        # variables
+        swarm_key = (ship_model, json.dumps(ship_variables, sort_keys=True))
+        swarm_gitem = self.__swarm_items.get(swarm_key)
+
+        if swarm_gitem is None:
+            swarm_gitem = SwarmGraphicsItem(
+                self.__loadGraphicItem(ship.body.shapes, images))
+            self.__swarm_items[swarm_key] = swarm_gitem
+            self.__ui.view.scene().addItem(swarm_gitem)
+
+        return swarm_gitem
+
     def __loadShip(self, ship_info, arg_scenario_info, fileinfo):
 
         arg_scenario_info['starting-position'] = ship_info.position
@@ -313,6 +385,7 @@ class MainWindow(QMainWindow):
         ship = loaded_ship.device
 
         self.__widgets = loaded_ship.widgets
+        self.__interface_devices.extend(loaded_ship.interface_devices)
         ship.body.position = ship_info.position
         ship.body.angle = ship_info.angle
 
@@ -334,51 +407,55 @@ class MainWindow(QMainWindow):
             ship_controller = '/'.join(ship_controller)
 
         msg_queue = SimpleQueue()
-        thread = fileinfo.loadController(ship_controller, ship, json_info,
-                                         msg_queue, self.__lock)
-
         self.__debug_msg_queues[ship.name] = msg_queue
 
-        ship_gitem = self.__loadGraphicItem(
-            ship.body.shapes, loaded_ship.images,
-            condition_variables={'ship': ship.mirror})
-
-        self.__ui.view.scene().addItem(ship_gitem)
+        ship_gitem = self.__loadShipGraphicItem(
+            ship, ship_model, ship_info.variables, loaded_ship.images)
 
         self.__ui.deviceInterfaceComboBox.addItem(
             f'{ship_info.name} ({ship_model})')
 
-        thread.start()
+        # The controller is started by __loadScenarioShips after every ship
+        # is loaded
+        controller_args = (ship_controller, ship, json_info, msg_queue,
+                           self.__lock)
 
-        return ship, ship_gitem, self.__widgets, thread
+        return ship, ship_gitem, self.__widgets, controller_args
 
-    def __loadObject(self, obj_info, fileinfo):
+    def __chooseObject(self, obj_info, fileinfo, collision_matrix):
 
-        obj_model = obj_info.model
-        if obj_model is None:
-            options = fileinfo.listFilesTree(
-                FileInfo.FileDataType.OBJECTMODEL).children
-            obj_model = self.__getOptionDialog('Choose object model',
-                                               options)
+        options = fileinfo.listFilesTree(
+            FileInfo.FileDataType.OBJECTMODEL).children
+        obj_model = self.__getOptionDialog('Choose object model', options)
 
-            if obj_model is None:
-                return None
+        if obj_model is None:
+            return None
 
-            obj_model = '/'.join(obj_model)
+        x, y = obj_info.position
+        object_info = fileinfo.loadObject('/'.join(obj_model), self.__space,
+                                          pose=(x, y, obj_info.angle))
 
-        object_info = fileinfo.loadObject(obj_model, self.__space)
+        if object_info.body is None:
+            applyCollisionMatrix(self.__space.static_body.shapes,
+                                 collision_matrix)
+            self.__space.reindex_static()
+        else:
+            applyCollisionMatrix(object_info.body.shapes, collision_matrix)
 
-        body = object_info.body
+        return object_info
 
-        body.position = obj_info.position
-        body.angle = obj_info.angle
+    def __loadObjectGraphicItem(self, object_info, pose):
 
         object_gitem = self.__loadGraphicItem(
-            body.shapes, object_info.images, default_color=Qt.gray)
+            object_info.shapes, object_info.images, default_color=Qt.gray)
+
+        x, y, angle = pose
+        object_gitem.setPos(x, y)
+        object_gitem.setRotation(180*angle/pi)
 
         self.__ui.view.scene().addItem(object_gitem)
 
-        return body, object_gitem
+        return object_gitem
 
     def __loadScenarioShips(self, ships_info, arg_scenario_info):
 
@@ -400,40 +477,125 @@ class MainWindow(QMainWindow):
 
             ships[i] = ship
 
-        return ships
+        fileinfo = FileInfo()
+
+        # Starting a controller process takes a while, so all of them are
+        # started at the same time
+        try:
+            with ThreadPoolExecutor() as executor:
+                threads = list(executor.map(
+                    lambda args: fileinfo.loadController(*args),
+                    (controller_args for _, _, _, controller_args in ships)))
+        except Exception as err:
+            self.clear()
+            QMessageBox.warning(self, 'Error', (
+                'An error occurred starting a controller: \n'
+                f'{type(err).__name__}: {err}'))
+            return None
+
+        for thread in threads:
+            thread.start()
+
+        return [(ship, ship_gitem, widgets, thread) for
+                (ship, ship_gitem, widgets, _), thread in zip(ships, threads)]
 
-    def __loadScenarioObjects(self, objects_info):
+    def __loadScenarioObjects(self, objects, collision_matrix, gravity_field):
 
-        objects = [None]*len(objects_info)
-        for i, obj_info in enumerate(objects_info):
+        loaded_objects = []
+        for obj_info, object_info in objects:
+
+            # Objects without model were not built by the loading thread
+            if object_info is None:
+                try:
+                    object_info = self.__chooseObject(obj_info, FileInfo(),
+                                                      collision_matrix)
+                except Exception as err:
+                    self.clear()
+                    QMessageBox.warning(self, 'Error', (
+                        'An error occurred loading an object: \n'
+                        f'{type(err).__name__}: {err}'))
+                    return None
+
+                if object_info is None:
+                    continue
+
+                if gravity_field is not None and object_info.body is not None:
+                    gravity_field.addBody(object_info.body)
+
+            x, y = obj_info.position
+            object_gitem = self.__loadObjectGraphicItem(
+                object_info, (x, y, obj_info.angle))
+
+            # Static objects never move, so their graphics are not updated
+            if object_info.body is not None:
+                loaded_objects.append((object_info.body, object_gitem))
+
+        return loaded_objects
+
+    def __loadObjectFieldGraphicItems(self, model, poses, loaded_objects):
+
+        first_object = loaded_objects[0]
+        is_static = first_object.body is None
+
+        images = first_object.images
+        if self.__batch_objects is True and self.__canBatchImages(images):
+
+            # Static objects are placed once, in a swarm of their own
+            if is_static:
+                swarm_gitem = SwarmGraphicsItem(self.__loadGraphicItem(
+                    first_object.shapes, images, default_color=Qt.gray))
+                swarm_gitem.setPoses(poses)
+                self.__ui.view.scene().addItem(swarm_gitem)
+                return []
+
+            swarm_key = (FileInfo.FileDataType.OBJECTMODEL, model)
+            swarm_gitem = self.__swarm_items.get(swarm_key)
+
+            if swarm_gitem is None:
+                swarm_gitem = SwarmGraphicsItem(self.__loadGraphicItem(
+                    first_object.shapes, images, default_color=Qt.gray))
+                self.__swarm_items[swarm_key] = swarm_gitem
+                self.__ui.view.scene().addItem(swarm_gitem)
+
+            return [(object_info.body, swarm_gitem)
+                    for object_info in loaded_objects]
+
+        objects = []
+        for object_info, pose in zip(loaded_objects, poses):
+            object_gitem = self.__loadObjectGraphicItem(object_info, pose)
+
+            if not is_static:
+                objects.append((object_info.body, object_gitem))
+
+        return objects
+
+    def __loadScenarioObjectFields(self, object_fields):
+
+        objects = []
+        for model, poses, loaded_objects in object_fields:
             try:
-                obj = self.__loadObject(obj_info, FileInfo())
+                objects.extend(self.__loadObjectFieldGraphicItems(
+                    model, poses, loaded_objects))
             except Exception as err:
                 self.clear()
                 QMessageBox.warning(self, 'Error', (
-                    f'An error occurred loading an object({obj_info.model}): \n'
+                    f'An error occurred loading the objects of {model}: \n'
                     f'{type(err).__name__}: {err}'))
                 return None
 
-            objects[i] = obj
-
         return objects
 
-    def __loadStaticImages(self, static_images):
+    def __loadStaticImages(self, static_images, background=False):
 
         for image_info in static_images:
-            pixmap = QPixmap(FileInfo().getPath(
-                FileInfo.FileDataType.IMAGE, image_info.name))
-            height = image_info.height
-            width = image_info.width
-
-            if height is None:
-                if width is not None:
-                    pixmap = pixmap.scaledToWidth(width)
-            elif width is None:
-                pixmap = pixmap.scaledToHeight(height)
-            else:
-                pixmap = pixmap.scaled(width, height)
+            pixmap = FileInfo().loadPixmap(
+                image_info.name, width=image_info.width,
+                height=image_info.height, disk_cache=True)
+
+            if background is True:
+                self.__ui.view.scene().addBackgroundPixmap(
+                    pixmap, image_info.x, image_info.y)
+                continue
 
             image_item = QGraphicsPixmapItem(pixmap)
 
@@ -444,26 +606,64 @@ class MainWindow(QMainWindow):
 
             self.__ui.view.scene().addItem(image_item)
 
+    def __loadingProgress(self, finished, total):
+        self.__loading_progress = (finished, total)
+
     def loadScenario(self, scenario):
+        """Start loading a scenario without blocking the interface.
 
-        self.clear()
+        The scenario files are parsed, its models compiled and its physics
+        world built by background threads, while the current scenario keeps
+        running. When that is done the current scenario is replaced by the
+        new one in a single call to `__timerTimeout`, which only creates the
+        ships and the graphics items.
+        """
 
-        fileinfo = FileInfo()
+        self.__loading_progress = (0, 1)
+        self.__loading = (scenario, self.__loading_executor.submit(
+            buildScenarioWorld, scenario,
+            progress_func=self.__loadingProgress))
+
+        self.__updateTitle()
+
+    def __checkLoading(self):
+
+        scenario, future = self.__loading
+
+        if not future.done():
+            self.__updateTitle()
+            return
+
+        self.__loading = None
 
         try:
-            scenario_info = fileinfo.loadScenario(scenario)
+            world = future.result()
         except Exception as err:
+            self.__updateTitle()
             QMessageBox.warning(self, 'Error', (
                 'An error occurred loading the scenario: \n'
                 f'{type(err).__name__}: {err}'))
             return
 
-        space_info = scenario_info.physics_engine
-        self.__space.damping = space_info.damping
-        self.__space.gravity = space_info.gravity
-        self.__space.collision_slop = space_info.collision_slop
-        self.__space.collision_persistence = space_info.collision_persistence
-        self.__space.iterations = space_info.iterations
+        self.__startScenario(scenario, world)
+
+    def __startScenario(self, scenario, world):
+
+        self.clear()
+
+        scenario_info = world.scenario_info
+        self.__space = world.space
+
+        rendering_info = scenario_info.rendering
+        self.__ui.view.scene().setItemIndexMethod(
+            QGraphicsScene.BspTreeIndex if rendering_info.index_items else
+            QGraphicsScene.NoIndex)
+        self.__ui.view.setCacheMode(
+            QGraphicsView.CacheBackground if rendering_info.static_background
+            else QGraphicsView.CacheNone)
+        self.__cull_offscreen = rendering_info.cull_offscreen
+        self.__batch_ships = rendering_info.batch_ships
+        self.__batch_objects = rendering_info.batch_objects
 
         self.__ui.deviceInterfaceWidgets.setVisible(
             scenario_info.visible_user_interface)
@@ -486,15 +686,31 @@ class MainWindow(QMainWindow):
         if ships is None:
             return
 
-        objects = self.__loadScenarioObjects(scenario_info.objects)
+        gravity_field = world.gravity_field
+
+        # The objects were already built by the loading thread, only the
+        # ships are added to the space here
+        for ship, _, _, _ in ships:
+            applyCollisionMatrix(ship.body.shapes,
+                                 scenario_info.collision_matrix)
+
+            if gravity_field is not None:
+                gravity_field.addBody(ship.body)
+
+        objects = self.__loadScenarioObjects(
+            world.objects, scenario_info.collision_matrix, gravity_field)
         if objects is None:
             return
 
+        field_objects = self.__loadScenarioObjectFields(world.object_fields)
+        if field_objects is None:
+            return
+
+        objects.extend(field_objects)
+
         self.__ships = ships
         self.__objects = objects
 
-        self.__space.reindex_static()
-
         for widget in self.__ships[0][2]:
             widget.show()
 
@@ -514,9 +730,10 @@ class MainWindow(QMainWindow):
         else:
             self.__ui.treeView.hide()
 
-        self.__loadStaticImages(scenario_info.static_images)
+        self.__loadStaticImages(
+            scenario_info.static_images,
+            background=scenario_info.rendering.static_background)
 
-        self.__current_scenario = scenario
         self.__ui.deviceInterfaceComboBox.setVisible(len(self.__ships) > 1)
 
         self.__ui.debugMessagesTabWidget.clear()
@@ -526,35 +743,173 @@ class MainWindow(QMainWindow):
             self.__debug_messages_text_browsers[ship.name] = tbrowser
             self.__ui.debugMessagesTabWidget.addTab(tbrowser, ship.name)
 
+        engine_info = scenario_info.physics_engine
+
+        try:
+            object_spawner = self.__createObjectSpawner(scenario_info,
+                                                        world.object_pools)
+
+            self.__simulation = SimulationThread(
+                self.__space, (ship for ship, _, _, _ in self.__ships),
+                (body for body, _ in self.__objects), self.__comm_engine,
+                self.__scenario_objectives, self.__lock,
+                step_time=engine_info.step_time,
+                substep_scheduler=SubstepScheduler(
+                    self.__space, max_substeps=engine_info.max_substeps,
+                    max_displacement=engine_info.max_displacement,
+                    contact_substeps=engine_info.contact_substeps),
+                gravity_field=gravity_field,
+                world_chunks=self.__createWorldChunks(engine_info.streaming),
+                chunks_interval=(1 if engine_info.streaming is None else
+                                 engine_info.streaming.update_interval),
+                object_spawner=object_spawner)
+            self.__simulation.start()
+        except Exception as err:
+            # Removing the ships from the space also stops their controllers
+            self.clear()
+            QMessageBox.warning(self, 'Error', (
+                'An error occurred starting the simulation: \n'
+                f'{type(err).__name__}: {err}'))
+            return
+
+        # The scenario is only shown as running once the simulation started
+        self.__current_scenario = scenario
+
+    def __createWorldChunks(self, streaming_info):
+
+        if streaming_info is None:
+            return None
+
+        return WorldChunks(self.__space, [body for body, _ in self.__objects],
+                           streaming_info.chunk_size,
+                           streaming_info.activation_distance)
+
+    def __createObjectSpawner(self, scenario_info, pools):
+
+        if not pools:
+            return None
+
+        # The spawned objects of each model are drawn by a single item kept
+        # for the whole scenario, so spawning them doesn't change the scene
+        for pool in pools.values():
+            swarm_gitem = SwarmGraphicsItem(self.__loadGraphicItem(
+                pool.shapes, pool.images, default_color=Qt.gray))
+            self.__spawned_items.append(swarm_gitem)
+            self.__ui.view.scene().addItem(swarm_gitem)
+
+        emitters = tuple(
+            ObjectEmitter(emitter.model, (*emitter.position, emitter.angle),
+                          speed=emitter.speed, spread=emitter.spread,
+                          interval=emitter.interval,
+                          lifetime=emitter.lifetime)
+            for emitter in scenario_info.emitters)
+
+        object_spawner = ObjectSpawner(pools, emitters=emitters)
+
+        for ship, _, _, _ in self.__ships:
+            ship.spawner = object_spawner
+
+        return object_spawner
+
     @staticmethod
-    def __updateGraphicsItem(body, gitem):
+    def __updateGraphicsItem(pose, gitem, visible_rect=None):
+
+        x, y, angle = pose
 
-        pos = body.position
-        gitem.setX(pos.x)
-        gitem.setY(pos.y)
+        if visible_rect is not None:
+            # Items that are not visible before or after moving are left
+            # behind, they are placed again when they get close to the view
+            item_rect = gitem.sceneBoundingRect()
+            if not visible_rect.intersects(item_rect):
+                item_rect.translate(x - gitem.x(), y - gitem.y())
+                if not visible_rect.intersects(item_rect):
+                    return False
+
+        gitem.setX(x)
+        gitem.setY(y)
         gitem.prepareGeometryChange()
-        gitem.setRotation(180*body.angle/pi)
+        gitem.setRotation(180*angle/pi)
+
+        return True
+
+    def __updateGraphicsItems(self, state):
+
+        if self.__cull_offscreen is True:
+            view = self.__ui.view
+            visible_rect = view.mapToScene(
+                view.viewport().rect()).boundingRect()
+        else:
+            visible_rect = None
+
+        swarm_poses = {}
+        for (_, gitem, _, _), pose in zip(self.__ships, state.ship_poses):
+            if isinstance(gitem, SwarmGraphicsItem):
+                swarm_poses.setdefault(gitem, []).append(pose)
+            else:
+                self.__updateGraphicsItem(pose, gitem,
+                                          visible_rect=visible_rect)
+
+        last_state = self.__last_simulation_state
+
+        # Only the objects that moved since the last state shown and the ones
+        # left behind by the culling are updated, unless states were skipped
+        if last_state is not None and state.step == last_state.step + 1:
+            moved_objects = self.__culled_objects.union(state.moved_objects)
+        else:
+            moved_objects = range(len(self.__objects))
+
+        culled_objects = set()
+        object_poses = state.object_poses
+        for i in moved_objects:
+            _, gitem = self.__objects[i]
+            if isinstance(gitem, SwarmGraphicsItem):
+                swarm_poses.setdefault(gitem, None)
+            elif not self.__updateGraphicsItem(object_poses[i], gitem,
+                                               visible_rect=visible_rect):
+                culled_objects.add(i)
+
+        self.__culled_objects = culled_objects
+
+        for swarm_gitem, poses in swarm_poses.items():
+            if poses is None:
+                poses = self.__objectSwarmPoses(swarm_gitem, object_poses)
+            swarm_gitem.setPoses(poses)
+
+        for swarm_gitem, poses in zip(self.__spawned_items,
+                                      state.spawned_poses):
+            swarm_gitem.setPoses(poses)
+
+    def __objectSwarmPoses(self, swarm_gitem, object_poses):
+        return [pose for (_, gitem), pose in zip(self.__objects, object_poses)
+                if gitem is swarm_gitem]
 
     def __timerTimeout(self):
 
+        if self.__loading is not None:
+            self.__checkLoading()
+
         if self.__current_scenario is None:
             return
 
-        ships = tuple(ship for ship, _, _, _ in self.__ships)
-        with self.__lock:
-            self.__space.step(0.02)
-            for ship, gitem, _, _ in self.__ships:
-                ship.act()
-                self.__updateGraphicsItem(ship.body, gitem)
-
-            for obj_body, gitem in self.__objects:
-                self.__updateGraphicsItem(obj_body, gitem)
+        error = self.__simulation.error
+        if error is not None:
+            self.clear()
+            QMessageBox.warning(self, 'Error', (
+                'An error occurred in the simulation: \n'
+                f'{type(error).__name__}: {error}'))
+            return
 
-            self.__comm_engine.step()
+        # The physics is stepped by the simulation thread, only the latest
+        # published state is read here so painting never waits for a step
+        state = self.__simulation.state
+        if state is not None and state is not self.__last_simulation_state:
+            self.__updateGraphicsItems(state)
+            self.__last_simulation_state = state
+            self.__objectives_complete = state.objectives_complete
 
-            self.__objectives_complete = all(
-                objective.verify(self.__space, ships)
-                for objective in self.__scenario_objectives)
+        with self.__lock:
+            for device in self.__interface_devices:
+                device.processActions()
 
             if self.__condition_graphic_items:
                 timestamp = time.time()
@@ -2,7 +2,7 @@
 from abc import ABC, abstractmethod
 from PyQt5.QtWidgets import QGraphicsItem
 from PyQt5.QtCore import QRectF, QPointF, Qt
-from PyQt5.QtGui import QPolygonF
+from PyQt5.QtGui import QPolygonF, QPainterPath, QPen, QBrush, QColor
 
 import pymunk
 
@@ -21,6 +21,10 @@ class DrawingPart(ABC):
     def _paint(self, painter, option, widget) -> None:
         pass
 
+    @abstractmethod
+    def path(self) -> QPainterPath:
+        pass
+
 class EllipseDrawingPart(DrawingPart):
 
     def __init__(self, height, width, color=None,
@@ -55,6 +59,11 @@ class EllipseDrawingPart(DrawingPart):
 
         painter.drawEllipse(self.__offset, self.__b_radius, self.__a_radius)
 
+    def path(self) -> QPainterPath:
+        path = QPainterPath()
+        path.addEllipse(self.__offset, self.__b_radius, self.__a_radius)
+        return path
+
 class CircleDrawingPart(EllipseDrawingPart):
 
     def __init__(self, radius, **kwargs) -> None:
@@ -84,6 +93,11 @@ class LineDrawingPart(DrawingPart):
 
         painter.drawLine(self.__start, self.__end)
 
+    def path(self) -> QPainterPath:
+        path = QPainterPath(self.__start)
+        path.lineTo(self.__end)
+        return path
+
 class PolyDrawingPart(DrawingPart):
 
     def __init__(self, points, color=None, border_color=None,
@@ -125,6 +139,12 @@ class PolyDrawingPart(DrawingPart):
 
         painter.drawPolygon(self.__polygon)
 
+    def path(self) -> QPainterPath:
+        path = QPainterPath()
+        path.addPolygon(self.__polygon)
+        path.closeSubpath()
+        return path
+
 class ObjectGraphicsItem(QGraphicsItem):
 
     def __init__(self, shapes, color=Qt.blue) -> None:
@@ -144,15 +164,27 @@ class ObjectGraphicsItem(QGraphicsItem):
                                shape.get_vertices())
                 self.__parts.append(PolyDrawingPart(points, color=color))
 
-        self.__bounding_rect = QRectF(0, 0, 0, 0)
+        # All parts share the same color, so they are merged into a single
+        # path that is built once and drawn with a single call
+        self.__path = QPainterPath()
         for part in self.__parts:
-            self.__bounding_rect |= part.boundingRect()
+            self.__path = self.__path.united(part.path())
 
-    @staticmethod
-    def boundingRect() -> QRectF:
-        return QRectF(-100, -100, 200, 200)
+        self.__pen = QPen(QColor(color))
+        self.__brush = QBrush(QColor(color))
+
+        self.__bounding_rect = self.__path.boundingRect().adjusted(-1, -1, 1, 1)
+
+        self.setCacheMode(QGraphicsItem.ItemCoordinateCache)
+
+    def boundingRect(self) -> QRectF:
+        return self.__bounding_rect
+
+    def shape(self) -> QPainterPath:
+        return self.__path
 
     def paint(self, painter, option, widget) -> None:
 
-        for part in self.__parts:
-            part.paint(painter, option, widget)
+        painter.setPen(self.__pen)
+        painter.setBrush(self.__brush)
+        painter.drawPath(self.__path)
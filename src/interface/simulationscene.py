@@ -0,0 +1,31 @@
+from PyQt5.QtWidgets import QGraphicsScene
+from PyQt5.QtCore import QRectF
+
+class SimulationScene(QGraphicsScene):
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.__background_pixmaps = []
+
+    def addBackgroundPixmap(self, pixmap: 'QPixmap', x: float,
+                            y: float) -> None:
+        # The pixmap is not a scene item, so it's not part of the item index
+        # and, when the view caches its background, it's only drawn again
+        # when the view is scrolled or resized
+        rect = QRectF(x - pixmap.width()/2, y - pixmap.height()/2,
+                      pixmap.width(), pixmap.height())
+
+        self.__background_pixmaps.append((rect, pixmap))
+        self.invalidate(rect, QGraphicsScene.BackgroundLayer)
+
+    def clearBackground(self) -> None:
+        self.__background_pixmaps.clear()
+        self.invalidate(layers=QGraphicsScene.BackgroundLayer)
+
+    def drawBackground(self, painter: 'QPainter', rect: QRectF) -> None:
+        super().drawBackground(painter, rect)
+
+        for pixmap_rect, pixmap in self.__background_pixmaps:
+            if pixmap_rect.intersects(rect):
+                painter.drawPixmap(pixmap_rect.topLeft(), pixmap)
@@ -0,0 +1,88 @@
+from math import pi, hypot
+
+from PyQt5.QtWidgets import QGraphicsItem
+from PyQt5.QtCore import QRectF
+from PyQt5.QtGui import QTransform
+
+class SwarmGraphicsItem(QGraphicsItem):
+
+    def __init__(self, template: QGraphicsItem) -> None:
+        super().__init__()
+
+        self.__template = template
+        self.__parts = []
+        self.__addTemplatePart(template, QTransform())
+
+        template_rect = QRectF()
+        for part, part_transform in self.__parts:
+            template_rect |= part_transform.mapRect(part.boundingRect())
+
+        self.__radius = max(
+            hypot(corner.x(), corner.y()) for corner in (
+                template_rect.topLeft(), template_rect.topRight(),
+                template_rect.bottomLeft(), template_rect.bottomRight()))
+
+        self.__poses = ()
+        self.__bounding_rect = QRectF()
+
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+
+    def __addTemplatePart(self, item, transform):
+
+        # Groups don't paint anything, only their children are kept
+        if not item.childItems():
+            self.__parts.append((item, transform))
+
+        for child in item.childItems():
+            child_transform, _ = child.itemTransform(item)
+            self.__addTemplatePart(child, child_transform*transform)
+
+    def setPoses(self,
+                 poses: 'Sequence[Tuple[float, float, float]]') -> None:
+
+        radius = self.__radius
+
+        poses = tuple((x, y, 180*angle/pi) for x, y, angle in poses)
+
+        # Swarms of objects that don't move are not repainted
+        if poses == self.__poses:
+            return
+
+        if poses:
+            min_x = min(x for x, _, _ in poses) - radius
+            min_y = min(y for _, y, _ in poses) - radius
+            max_x = max(x for x, _, _ in poses) + radius
+            max_y = max(y for _, y, _ in poses) + radius
+            bounding_rect = QRectF(min_x, min_y, max_x - min_x, max_y - min_y)
+        else:
+            bounding_rect = QRectF()
+
+        self.prepareGeometryChange()
+        self.__poses = poses
+        self.__bounding_rect = bounding_rect
+
+    def boundingRect(self) -> QRectF:
+        return self.__bounding_rect
+
+    def paint(self, painter, option, widget) -> None:
+
+        radius = self.__radius
+        diameter = 2*radius
+        exposed_rect = option.exposedRect
+
+        base_transform = painter.transform()
+
+        for x, y, angle in self.__poses:
+
+            if not exposed_rect.intersects(QRectF(x - radius, y - radius,
+                                                  diameter, diameter)):
+                continue
+
+            instance_transform = QTransform().translate(
+                x, y).rotate(angle)*base_transform
+
+            for part, part_transform in self.__parts:
+                painter.setTransform(part_transform*instance_transform)
+                part.paint(painter, option, widget)
+
+        painter.setTransform(base_transform)
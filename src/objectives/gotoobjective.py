@@ -25,7 +25,9 @@ class GoToObjective(Objective):
         return pos.get_dist_sqrd(self.__position) < self.__distance_sqrtd
 
     def _verify(self, space: 'pymunk.Space', ships: 'Sequence[Device]') -> bool:
-        return any(self._verifyShip(ship) for ship in ships)
+        # Sleeping ships didn't move since they were last verified
+        return any(self._verifyShip(ship) for ship in ships
+                   if not ship.body.is_sleeping)
 
     @property
     def info(self) -> 'Dict[str, Any]':
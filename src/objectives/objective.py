@@ -1,8 +1,6 @@
 
 from abc import ABC, abstractmethod, abstractproperty
 
-from anytree import Node
-
 class Objective(ABC):
 
     def __init__(self, name: str, description: str) -> None:
@@ -86,6 +84,8 @@ class ObjectiveGroup(Objective):
 def createObjectiveTree(objective: 'Union[Objective, Sequence[Objective]]',
                         parent: 'Node' = None) -> 'Node':
 
+    from anytree import Node # pylint: disable=import-outside-toplevel
+
     current_node = Node(objective, parent=parent)
 
     if isinstance(objective, ObjectiveGroup):
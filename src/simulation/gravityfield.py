@@ -0,0 +1,188 @@
+from pymunk import Body
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class GravityField:
+    """Gravity of point masses and, optionally, of the bodies themselves.
+
+    The acceleration of every body is computed at once with NumPy by
+    `update`, before each step of the space, and added to the uniform
+    gravity of the space by the velocity function of the body.
+
+    With `n_body` the bodies attract each other too. Up to `direct_limit`
+    bodies every pair is computed, above that the bodies are grouped in a
+    grid of square cells of `cell_size` side, each body is attracted directly
+    by the bodies in its own and the neighbour cells and by the center of
+    mass of every farther cell.
+
+    Args:
+        bodies: Bodies affected by the field.
+        sources: Position and mass of each fixed point mass.
+        constant: Gravitational constant.
+        softening: Distance added to every distance, avoids huge forces
+            between bodies that are too close.
+        n_body: If the bodies attract each other.
+        cell_size: Side of the cells of the grid approximation.
+        direct_limit: Maximum number of bodies whose pairs are all computed.
+    """
+
+    def __init__(self, bodies: 'Sequence[pymunk.Body]',
+                 sources: 'Sequence[Tuple[Tuple[float, float], float]]' = (),
+                 constant: float = 1, softening: float = 1,
+                 n_body: bool = False, cell_size: float = 1000,
+                 direct_limit: int = 512) -> None:
+
+        if numpy is None:
+            raise Exception('NumPy is needed to use gravity fields, install '
+                            'it with \'pip install numpy\'')
+
+        # Used as an ordered set, so bodies can be removed quickly
+        self.__bodies = {}
+
+        if sources:
+            self.__source_positions = numpy.array(
+                [position for position, _ in sources], dtype=float)
+            self.__source_masses = numpy.array(
+                [mass for _, mass in sources], dtype=float)
+        else:
+            self.__source_positions = None
+            self.__source_masses = None
+
+        self.__constant = constant
+        self.__softening_sqrd = softening**2
+        self.__n_body = n_body
+        self.__cell_size = cell_size
+        self.__direct_limit = direct_limit
+
+        self.__accelerations = {}
+
+        for body in bodies:
+            self.addBody(body)
+
+    @property
+    def accelerations(self) -> 'List[Tuple[float, float]]':
+        """Acceleration of each body computed by the last `update`."""
+        return [self.__accelerations[body] for body in self.__bodies]
+
+    def addBody(self, body: 'pymunk.Body') -> None:
+        """Make the field affect a body, only dynamic bodies are affected."""
+
+        if body.body_type != Body.DYNAMIC:
+            return
+
+        self.__bodies[body] = None
+        self.__accelerations[body] = (0, 0)
+        body.velocity_func = self.__velocityFunc
+
+    def removeBody(self, body: 'pymunk.Body') -> None:
+
+        if self.__bodies.pop(body, False) is not False:
+            del self.__accelerations[body]
+            body.velocity_func = Body.update_velocity
+
+    def __velocityFunc(self, body, gravity, damping, dt):
+        acc_x, acc_y = self.__accelerations.get(body, (0, 0))
+        Body.update_velocity(body, (gravity[0] + acc_x, gravity[1] + acc_y),
+                             damping, dt)
+
+    def __attraction(self, positions, attractor_positions, attractor_masses):
+
+        # Computed in blocks so the pairwise arrays stay small
+        accelerations = numpy.empty_like(positions)
+        block_size = max(1, (1 << 20)//max(1, len(attractor_masses)))
+
+        for start in range(0, len(positions), block_size):
+            block = positions[start:start + block_size]
+
+            diffs = attractor_positions[numpy.newaxis, :, :] - \
+                block[:, numpy.newaxis, :]
+            dists_sqrd = (diffs**2).sum(axis=2) + self.__softening_sqrd
+            factors = attractor_masses/(dists_sqrd*numpy.sqrt(dists_sqrd))
+
+            accelerations[start:start + block_size] = \
+                (diffs*factors[:, :, numpy.newaxis]).sum(axis=1)
+
+        return accelerations
+
+    def __gridAttraction(self, positions, masses):
+
+        cells = numpy.floor(positions/self.__cell_size).astype(numpy.int64)
+        cell_coords, cell_indexes = numpy.unique(cells, axis=0,
+                                                 return_inverse=True)
+        cell_indexes = cell_indexes.reshape(-1)
+        cell_count = len(cell_coords)
+
+        cell_masses = numpy.bincount(cell_indexes, weights=masses)
+        cell_centers = numpy.stack(
+            [numpy.bincount(cell_indexes, weights=masses*positions[:, axis])
+             for axis in (0, 1)], axis=1)/cell_masses[:, numpy.newaxis]
+
+        # The bodies are sorted by cell, so the bodies of each cell are
+        # contiguous in `order`
+        order = numpy.argsort(cell_indexes, kind='stable')
+        bounds = numpy.searchsorted(cell_indexes[order],
+                                    numpy.arange(cell_count + 1))
+
+        cell_ids = {tuple(coords): i
+                    for i, coords in enumerate(cell_coords.tolist())}
+
+        accelerations = numpy.empty_like(positions)
+        for cell, (cell_x, cell_y) in enumerate(cell_coords.tolist()):
+
+            near_cells = [cell_ids[key] for key in
+                          ((cell_x + dx, cell_y + dy) for dx in (-1, 0, 1)
+                           for dy in (-1, 0, 1))
+                          if key in cell_ids]
+
+            # The bodies of the own and the neighbour cells attract directly,
+            # only farther cells are replaced by their center of mass
+            near_bodies = numpy.concatenate(
+                [order[bounds[i]:bounds[i + 1]] for i in near_cells])
+            far_cells = numpy.ones(cell_count, dtype=bool)
+            far_cells[near_cells] = False
+
+            cell_bodies = order[bounds[cell]:bounds[cell + 1]]
+            cell_positions = positions[cell_bodies]
+
+            cell_accelerations = self.__attraction(
+                cell_positions, positions[near_bodies], masses[near_bodies])
+
+            if far_cells.any():
+                cell_accelerations += self.__attraction(
+                    cell_positions, cell_centers[far_cells],
+                    cell_masses[far_cells])
+
+            accelerations[cell_bodies] = cell_accelerations
+
+        return accelerations
+
+    def update(self) -> None:
+
+        bodies = tuple(self.__bodies)
+        if not bodies:
+            return
+
+        positions = numpy.array([tuple(body.position) for body in bodies],
+                                dtype=float)
+        accelerations = numpy.zeros_like(positions)
+
+        if self.__source_masses is not None:
+            accelerations += self.__attraction(
+                positions, self.__source_positions, self.__source_masses)
+
+        if self.__n_body and len(bodies) > 1:
+            masses = numpy.array([body.mass for body in bodies], dtype=float)
+
+            if len(bodies) <= self.__direct_limit:
+                # A body doesn't attract itself, its distance is the
+                # softening alone, so its contribution is zero
+                accelerations += self.__attraction(positions, positions,
+                                                   masses)
+            else:
+                accelerations += self.__gridAttraction(positions, masses)
+
+        self.__accelerations = dict(
+            zip(bodies, (self.__constant*accelerations).tolist()))
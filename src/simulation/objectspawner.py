@@ -0,0 +1,247 @@
+import heapq
+import random
+import itertools
+from math import cos, sin
+
+from .physicsengine import applyCollisionMatrix
+from .simulationthread import bodyPose
+
+from ..storage.loaders.objectloader import buildBody
+from ..storage.loaders.shapeloader import buildShapes
+
+class ObjectPool:
+    """Bodies of an object model that are reused after being despawned.
+
+    Despawned bodies and their shapes are only removed from the space and kept
+    to be spawned again, new ones are built only when none is free.
+
+    Args:
+        space: Physics engine space the objects are spawned in.
+        blueprint: Compiled object model, it can't be static.
+        capacity: Number of bodies built when the pool is created.
+        max_count: Maximum number of objects spawned at the same time, if
+            None there is no limit.
+        collision_matrix: Collision matrix applied to the shapes built.
+        gravity_field: Gravity field that affects the spawned bodies.
+    """
+
+    def __init__(self, space: 'pymunk.Space', blueprint: 'ObjectBlueprint',
+                 capacity: int = 0, max_count: int = None,
+                 collision_matrix: 'Sequence[Tuple[int, int]]' = (),
+                 gravity_field: 'GravityField' = None) -> None:
+
+        self.__space = space
+        self.__blueprint = blueprint
+        self.__max_count = max_count
+        self.__collision_matrix = collision_matrix
+        self.__gravity_field = gravity_field
+
+        self.__free = [self.__build() for _ in range(capacity)]
+        self.__spawned = {}
+
+        # Shapes in the object coordinates, used only to draw the objects
+        self.__model_shapes = buildShapes(blueprint.shapes)
+
+    def __build(self):
+        body, shapes = buildBody(self.__blueprint)
+        applyCollisionMatrix(shapes, self.__collision_matrix)
+        return body, shapes
+
+    @property
+    def images(self) -> 'Sequence[ImageInfo]':
+        return self.__blueprint.images
+
+    @property
+    def shapes(self) -> 'Sequence[pymunk.Shape]':
+        return self.__model_shapes
+
+    def bodies(self) -> 'Iterator[pymunk.Body]':
+        return (body for body, _ in self.__spawned.values())
+
+    def poses(self) -> 'Tuple[Tuple[float, float, float], ...]':
+        return tuple(bodyPose(body) for body, _ in self.__spawned.values())
+
+    def acquire(self, handle: int, pose: 'Tuple[float, float, float]',
+                velocity: 'Tuple[float, float]' = (0, 0),
+                angular_velocity: float = 0) -> bool:
+        """Spawn an object, returns False if the pool is full."""
+
+        if self.__max_count is not None and \
+            len(self.__spawned) >= self.__max_count:
+
+            return False
+
+        if self.__free:
+            body, shapes = self.__free.pop()
+        else:
+            body, shapes = self.__build()
+
+        x, y, angle = pose
+        body.position = x, y
+        body.angle = angle
+        body.velocity = velocity
+        body.angular_velocity = angular_velocity
+        body.force = 0, 0
+        body.torque = 0
+
+        self.__space.add(body, *shapes)
+        self.__spawned[handle] = (body, shapes)
+
+        if self.__gravity_field is not None:
+            self.__gravity_field.addBody(body)
+
+        return True
+
+    def release(self, handle: int) -> bool:
+        """Despawn an object, returns False if it was not spawned."""
+
+        spawned = self.__spawned.pop(handle, None)
+        if spawned is None:
+            return False
+
+        body, shapes = spawned
+        self.__space.remove(body, *shapes)
+
+        if self.__gravity_field is not None:
+            self.__gravity_field.removeBody(body)
+
+        self.__free.append(spawned)
+
+        return True
+
+class ObjectEmitter:
+    """Spawns objects of a model periodically from a fixed pose.
+
+    Args:
+        model: Object model spawned.
+        pose: Pose of the spawned objects.
+        speed: Speed of the spawned objects, in the direction of their angle.
+        spread: Maximum random variation of the angle, in radians, in each
+            direction.
+        interval: Time, in seconds of simulation, between each object.
+        lifetime: Time, in seconds of simulation, until each object is
+            despawned, if None they are never despawned.
+    """
+
+    def __init__(self, model: str, pose: 'Tuple[float, float, float]',
+                 speed: float = 0, spread: float = 0, interval: float = 1,
+                 lifetime: float = None) -> None:
+
+        self.__model = model
+        self.__pose = pose
+        self.__speed = speed
+        self.__spread = spread
+        self.__interval = interval
+        self.__lifetime = lifetime
+
+        self.__next_time = 0
+
+    def step(self, spawner: 'ObjectSpawner') -> None:
+
+        x, y, angle = self.__pose
+        speed = self.__speed
+
+        while self.__next_time <= spawner.time:
+            self.__next_time += self.__interval
+
+            spawn_angle = angle + random.uniform(-self.__spread,
+                                                 self.__spread)
+
+            spawner.spawn(self.__model, (x, y, spawn_angle),
+                          velocity=(speed*cos(spawn_angle),
+                                    speed*sin(spawn_angle)),
+                          lifetime=self.__lifetime)
+
+class ObjectSpawner:
+    """Spawns and despawns objects while the simulation runs.
+
+    Each object model has its own `ObjectPool`, so the bodies are reused
+    instead of being created for every spawned object. It is used by the
+    simulation thread while holding the simulation lock, by devices in their
+    `act` and by the scenario emitters.
+
+    Args:
+        pools: Pool of each object model that may be spawned.
+        emitters: Emitters stepped with the spawner.
+    """
+
+    def __init__(self, pools: 'Dict[str, ObjectPool]',
+                 emitters: 'Sequence[ObjectEmitter]' = ()) -> None:
+
+        self.__pools = dict(pools)
+        self.__pools_order = tuple(self.__pools.values())
+        self.__emitters = tuple(emitters)
+
+        self.__handles = itertools.count()
+        self.__spawned_pools = {}
+        self.__expirations = []
+        self.__time = 0
+
+    @property
+    def models(self) -> 'Tuple[str, ...]':
+        return tuple(self.__pools)
+
+    @property
+    def time(self) -> float:
+        """Time, in seconds of simulation, since the spawner started."""
+        return self.__time
+
+    def spawn(self, model: str, pose: 'Tuple[float, float, float]',
+              velocity: 'Tuple[float, float]' = (0, 0),
+              angular_velocity: float = 0,
+              lifetime: float = None) -> 'Optional[int]':
+        """Spawn an object.
+
+        Returns:
+            Handle of the object, to despawn it, or None if too many objects
+            of the model are already spawned.
+        """
+
+        pool = self.__pools.get(model)
+        if pool is None:
+            raise Exception(f'Object model \'{model}\' can\'t be spawned')
+
+        handle = next(self.__handles)
+        if not pool.acquire(handle, pose, velocity=velocity,
+                            angular_velocity=angular_velocity):
+            return None
+
+        self.__spawned_pools[handle] = pool
+
+        if lifetime is not None:
+            heapq.heappush(self.__expirations,
+                           (self.__time + lifetime, handle))
+
+        return handle
+
+    def despawn(self, handle: int) -> bool:
+
+        pool = self.__spawned_pools.pop(handle, None)
+        if pool is None:
+            return False
+
+        return pool.release(handle)
+
+    def step(self, step_time: float) -> None:
+        """Advance the time, despawning the expired objects."""
+
+        self.__time += step_time
+
+        for emitter in self.__emitters:
+            emitter.step(self)
+
+        expirations = self.__expirations
+        while expirations and expirations[0][0] <= self.__time:
+            _, handle = heapq.heappop(expirations)
+            self.despawn(handle)
+
+    def bodies(self) -> 'Iterator[pymunk.Body]':
+        return itertools.chain.from_iterable(pool.bodies()
+                                             for pool in self.__pools_order)
+
+    def poses(self) -> 'Tuple[Tuple[Tuple[float, float, float], ...], ...]':
+        """Poses of the spawned objects of each model, in `models` order."""
+        return tuple(pool.poses() for pool in self.__pools_order)
+
+    def pool(self, model: str) -> ObjectPool:
+        return self.__pools[model]
@@ -0,0 +1,62 @@
+import pymunk
+
+def createSpace(engine_info: 'PhysicsEngineInfo') -> pymunk.Space:
+    """Create a physics engine space configured as a scenario requests.
+
+    A new space is needed for every scenario, since a space can't stop using
+    threads or the spatial hash once it starts.
+    """
+
+    threaded = engine_info.threads > 1
+
+    space = pymunk.Space(threaded=threaded)
+
+    if threaded:
+        space.threads = engine_info.threads
+
+    space.damping = engine_info.damping
+    space.gravity = engine_info.gravity
+    space.collision_slop = engine_info.collision_slop
+    space.collision_persistence = engine_info.collision_persistence
+    space.iterations = engine_info.iterations
+    space.sleep_time_threshold = engine_info.sleep_time_threshold
+    space.idle_speed_threshold = engine_info.idle_speed_threshold
+
+    # The spatial hash is faster than the default tree when many objects of
+    # similar size are close to each other
+    if engine_info.spatial_hash is not None:
+        dimension, count = engine_info.spatial_hash
+        space.use_spatial_hash(dimension, count)
+
+    return space
+
+def applyCollisionMatrix(shapes: 'Iterable[pymunk.Shape]',
+                         collision_matrix: 'Sequence[Tuple[int, int]]') \
+                             -> None:
+    """Restrict the shapes collisions to the ones in a collision matrix.
+
+    Each shape in a category of the matrix stops colliding with the
+    categories not in its row. Shapes without categories are left as they
+    are.
+    """
+
+    if not collision_matrix:
+        return
+
+    # The default filter is in all categories, ALL_CATEGORIES is a method
+    # only since pymunk 6
+    all_categories = pymunk.ShapeFilter().categories
+
+    for shape in shapes:
+        shape_filter = shape.filter
+
+        if shape_filter.categories == all_categories:
+            continue
+
+        mask = shape_filter.mask
+        for category, category_mask in collision_matrix:
+            if shape_filter.categories & category:
+                mask &= category_mask
+
+        if mask != shape_filter.mask:
+            shape.filter = shape_filter._replace(mask=mask)
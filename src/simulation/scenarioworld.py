@@ -0,0 +1,127 @@
+from collections import namedtuple
+
+from .physicsengine import createSpace, applyCollisionMatrix
+from .gravityfield import GravityField
+from .objectspawner import ObjectPool
+
+from ..storage.fileinfo import FileInfo
+
+ScenarioWorld = namedtuple('ScenarioWorld', ('scenario_info', 'space',
+                                             'objects', 'object_fields',
+                                             'gravity_field', 'object_pools'))
+
+def __loadObjects(objects_info, space, fileinfo):
+
+    objects = []
+    for obj_info in objects_info:
+
+        # Objects without model are chosen by the user, later
+        if obj_info.model is None:
+            objects.append((obj_info, None))
+            continue
+
+        x, y = obj_info.position
+        try:
+            object_info = fileinfo.loadObject(obj_info.model, space,
+                                              pose=(x, y, obj_info.angle))
+        except Exception as err:
+            raise Exception(
+                f'An error occurred loading an object({obj_info.model}): '
+                f'{type(err).__name__}: {err}') from err
+
+        objects.append((obj_info, object_info))
+
+    return objects
+
+def __loadObjectField(field_info, space, fileinfo):
+
+    poses_by_model = {}
+    for obj_info in fileinfo.loadObjectField(field_info):
+        x, y = obj_info.position
+        poses_by_model.setdefault(obj_info.model, []).append(
+            (x, y, obj_info.angle))
+
+    # Each model is compiled once and all its objects are added to the space
+    # together
+    return tuple((model, poses, fileinfo.loadObjects(model, poses, space))
+                 for model, poses in poses_by_model.items())
+
+def __loadObjectFields(fields_info, space, fileinfo):
+
+    object_fields = []
+    for field_info in fields_info:
+        try:
+            object_fields.extend(__loadObjectField(field_info, space,
+                                                   fileinfo))
+        except Exception as err:
+            raise Exception(
+                f'An error occurred loading an object field({field_info.path})'
+                f': {type(err).__name__}: {err}') from err
+
+    return object_fields
+
+def __createGravityField(field_info, bodies):
+
+    if field_info is None:
+        return None
+
+    return GravityField(bodies, sources=field_info.sources,
+                        constant=field_info.constant,
+                        softening=field_info.softening,
+                        n_body=field_info.n_body,
+                        cell_size=field_info.cell_size,
+                        direct_limit=field_info.direct_limit)
+
+def buildScenarioWorld(scenario: str,
+                       progress_func: 'Callable[[int, int], None]' = None) \
+                           -> ScenarioWorld:
+    """Load a scenario and build the physics world of its objects.
+
+    Everything that doesn't need Qt is done here, so it may run in a loading
+    thread while another scenario is running: the space, the bodies and
+    shapes of the objects, the gravity field and the pools of the spawnable
+    objects. The ships, which have Qt widgets, and the graphics items are
+    created later by the GUI thread.
+
+    Args:
+        progress_func: Called as the `progress_func` of
+            `FileInfo.preloadScenario`.
+    """
+
+    fileinfo = FileInfo()
+
+    scenario_info = fileinfo.preloadScenario(scenario,
+                                             progress_func=progress_func)
+
+    engine_info = scenario_info.physics_engine
+    space = createSpace(engine_info)
+
+    objects = __loadObjects(scenario_info.objects, space, fileinfo)
+    object_fields = __loadObjectFields(scenario_info.object_fields, space,
+                                       fileinfo)
+
+    applyCollisionMatrix(space.shapes, scenario_info.collision_matrix)
+    space.reindex_static()
+
+    bodies = [object_info.body for _, object_info in objects
+              if object_info is not None]
+    bodies.extend(object_info.body for _, _, loaded_objects in object_fields
+                  for object_info in loaded_objects)
+
+    gravity_field = __createGravityField(
+        engine_info.gravity_field,
+        [body for body in bodies if body is not None])
+
+    object_pools = {
+        spawnable.model: ObjectPool(
+            space, fileinfo.loadObjectBlueprint(spawnable.model),
+            capacity=spawnable.capacity, max_count=spawnable.max_count,
+            collision_matrix=scenario_info.collision_matrix,
+            gravity_field=gravity_field)
+        for spawnable in fileinfo.scenarioSpawnables(scenario_info)}
+
+    return ScenarioWorld(scenario_info=scenario_info, space=space,
+                         objects=tuple(objects),
+                         object_fields=tuple(object_fields),
+                         gravity_field=gravity_field,
+                         object_pools=object_pools)
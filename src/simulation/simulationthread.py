@@ -0,0 +1,207 @@
+import time
+import itertools
+from threading import Thread, Event
+from collections import namedtuple
+
+SimulationState = namedtuple('SimulationState', ('step', 'ship_poses',
+                                                 'object_poses', 'moved_objects',
+                                                 'objectives_complete',
+                                                 'spawned_poses'))
+
+def bodyPose(body: 'pymunk.Body') -> 'Tuple[float, float, float]':
+    pos = body.position
+    return pos.x, pos.y, body.angle
+
+class SimulationThread(Thread):
+    """Thread that steps the simulation and publishes its state.
+
+    Every step the ships devices, the physics engine, the communication engine
+    and the objectives are updated while holding `lock`, then a new
+    `SimulationState` is published. The published states are never modified,
+    so the GUI thread can read the latest one from `state` without holding
+    the lock while the next step is being computed. An exception raised by a
+    step stops the thread and is kept in `error` for the GUI thread.
+
+    The poses of sleeping objects are not read again, each state has the
+    indexes of the objects that moved in its step, and the pose tuples of
+    objects that didn't move are the same objects of the previous state.
+
+    Args:
+        space: Physics engine space that will be stepped.
+        ships: Ships that will act every step.
+        object_bodies: Bodies of the scenario objects.
+        comm_engine: Communication engine that will be stepped.
+        objectives: Scenario objectives that will be verified every step.
+        lock: Lock that protects the simulation state.
+        step_time: Time, in seconds of simulation, of each physics step.
+        interval: Time, in real seconds, between each step.
+        substep_scheduler: Chooses in how many substeps each step is done,
+            if None every step is done at once.
+        gravity_field: Gravity field updated before every step of the space.
+        world_chunks: Chunks of the objects bodies, updated with the ships
+            positions every `chunks_interval` steps, only the poses of the
+            bodies in the space are read.
+        chunks_interval: Number of steps between each update of the chunks.
+        object_spawner: Spawner of the objects created while the simulation
+            runs, stepped after the space.
+    """
+
+    def __init__(self, space: 'pymunk.Space', ships: 'Sequence[Structure]',
+                 object_bodies: 'Sequence[pymunk.Body]',
+                 comm_engine: 'CommunicationEngine',
+                 objectives: 'Sequence[Objective]', lock: 'Lock',
+                 step_time: float = 0.02, interval: float = 0.1,
+                 substep_scheduler: 'SubstepScheduler' = None,
+                 gravity_field: 'GravityField' = None,
+                 world_chunks: 'WorldChunks' = None,
+                 chunks_interval: int = 10,
+                 object_spawner: 'ObjectSpawner' = None) -> None:
+        super().__init__(daemon=True)
+
+        self.__space = space
+        self.__ships = tuple(ships)
+        self.__object_bodies = tuple(object_bodies)
+        self.__comm_engine = comm_engine
+        self.__objectives = tuple(objectives)
+        self.__lock = lock
+        self.__step_time = step_time
+        self.__interval = interval
+        self.__substep_scheduler = substep_scheduler
+        self.__gravity_field = gravity_field
+        self.__world_chunks = world_chunks
+        self.__chunks_interval = chunks_interval
+        self.__object_spawner = object_spawner
+        self.__ship_bodies = tuple(ship.body for ship in self.__ships)
+
+        self.__stop_event = Event()
+        self.__state = None
+        self.__error = None
+        self.__step_count = 0
+        self.__object_poses = [bodyPose(body) for body in self.__object_bodies]
+
+    @property
+    def state(self) -> 'Optional[SimulationState]':
+        return self.__state
+
+    @property
+    def error(self) -> 'Optional[Exception]':
+        return self.__error
+
+    def stop(self) -> None:
+        self.__stop_event.set()
+
+    def run(self) -> None:
+
+        next_step_time = time.monotonic()
+        while not self.__stop_event.wait(
+                max(0, next_step_time - time.monotonic())):
+
+            try:
+                self.step()
+            except Exception as err: # pylint: disable=broad-except
+                self.__error = err
+                return
+
+            # When a step takes longer than the interval the simulation slows
+            # down instead of trying to catch up
+            next_step_time = max(next_step_time + self.__interval,
+                                 time.monotonic())
+
+    def __stepSpace(self):
+
+        space = self.__space
+        step_time = self.__step_time
+
+        if self.__substep_scheduler is None:
+            substeps = 1
+        else:
+            if self.__world_chunks is None:
+                object_bodies = self.__object_bodies
+            else:
+                object_bodies = (self.__object_bodies[i] for i in
+                                 self.__world_chunks.active_indexes)
+
+            if self.__object_spawner is not None:
+                object_bodies = itertools.chain(
+                    object_bodies, self.__object_spawner.bodies())
+
+            substeps = self.__substep_scheduler.substeps(
+                itertools.chain(self.__ship_bodies, object_bodies), step_time)
+
+        gravity_field = self.__gravity_field
+
+        if substeps == 1:
+            if gravity_field is not None:
+                gravity_field.update()
+
+            space.step(step_time)
+            return
+
+        # The engines forces are reset by every step of the space, they are
+        # applied again in each substep. Setting the forces of a body wakes
+        # it, so ships without forces are left alone
+        substep_time = step_time/substeps
+        for i in range(substeps):
+            if i > 0:
+                for ship in self.__ships:
+                    ship.applyStepForce()
+
+            if gravity_field is not None:
+                gravity_field.update()
+
+            space.step(substep_time)
+
+    def step(self) -> None:
+
+        ships = self.__ships
+
+        with self.__lock:
+            for ship in ships:
+                ship.act()
+
+            self.__stepSpace()
+
+            object_spawner = self.__object_spawner
+            if object_spawner is not None:
+                object_spawner.step(self.__step_time)
+
+            self.__comm_engine.step()
+
+            objectives_complete = all(
+                objective.verify(self.__space, ships)
+                for objective in self.__objectives)
+
+            ship_poses = tuple(bodyPose(ship.body) for ship in ships)
+
+            world_chunks = self.__world_chunks
+            if world_chunks is None:
+                object_indexes = range(len(self.__object_bodies))
+            else:
+                if self.__step_count % self.__chunks_interval == 0:
+                    world_chunks.update((x, y) for x, y, _ in ship_poses)
+                object_indexes = world_chunks.active_indexes
+
+            object_bodies = self.__object_bodies
+            object_poses = self.__object_poses
+            moved_objects = []
+            for i in object_indexes:
+                body = object_bodies[i]
+                if body.is_sleeping:
+                    continue
+
+                pose = bodyPose(body)
+                if pose != object_poses[i]:
+                    object_poses[i] = pose
+                    moved_objects.append(i)
+
+            if object_spawner is None:
+                spawned_poses = ()
+            else:
+                spawned_poses = object_spawner.poses()
+
+        self.__step_count += 1
+        self.__state = SimulationState(self.__step_count, ship_poses,
+                                       tuple(object_poses),
+                                       tuple(moved_objects),
+                                       objectives_complete,
+                                       spawned_poses)
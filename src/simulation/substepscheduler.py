@@ -0,0 +1,56 @@
+from math import ceil, inf
+
+class SubstepScheduler:
+    """Choose in how many substeps each simulation step is divided.
+
+    A step is done at once while nothing is touching and every body is slow,
+    when a body would move more than `max_displacement` in a substep or shapes
+    are in contact the step is divided, up to `max_substeps`.
+
+    Args:
+        space: Physics engine space, a collision handler is added to it to
+            count the contacts solved in each step when `contact_substeps`
+            is more than 1.
+        max_substeps: Maximum number of substeps of a step.
+        max_displacement: Maximum distance a body may move in a substep,
+            bounds the error of fast bodies.
+        contact_substeps: Number of substeps used while shapes are in contact.
+    """
+
+    def __init__(self, space: 'pymunk.Space', max_substeps: int = 1,
+                 max_displacement: float = inf,
+                 contact_substeps: int = 1) -> None:
+
+        self.__max_substeps = max_substeps
+        self.__max_displacement = max_displacement
+        self.__contact_substeps = contact_substeps
+        self.__contacts = 0
+
+        # Contacts are counted again in every step, instead of keeping count
+        # with begin and separate, so contacts of sleeping or removed bodies
+        # stop dividing the steps
+        if max_substeps > 1 and contact_substeps > 1:
+            handler = space.add_default_collision_handler()
+            handler.post_solve = self.__contactSolved
+
+    def __contactSolved(self, _arbiter, _space, _data):
+        self.__contacts += 1
+
+    def substeps(self, bodies: 'Iterable[pymunk.Body]',
+                 step_time: float) -> int:
+
+        max_substeps = self.__max_substeps
+        if max_substeps == 1:
+            return 1
+
+        # Contacts solved during the last step
+        substeps = self.__contact_substeps if self.__contacts > 0 else 1
+        self.__contacts = 0
+
+        if self.__max_displacement != inf:
+            max_speed = max((body.velocity.length for body in bodies
+                             if not body.is_sleeping), default=0)
+            substeps = max(substeps, ceil(max_speed*step_time/
+                                          self.__max_displacement))
+
+        return min(substeps, max_substeps)
@@ -0,0 +1,85 @@
+from math import floor, ceil
+
+class WorldChunks:
+    """Keep in the space only the bodies in chunks near the ships.
+
+    The world is divided in square chunks of `chunk_size` side, the bodies in
+    chunks farther than `activation_distance` from every ship are removed from
+    the space and kept with their state, until a ship gets close to their
+    chunk again.
+
+    Args:
+        space: Physics engine space the bodies are added to and removed from.
+        bodies: Bodies managed, they must already be in the space.
+        chunk_size: Side of each chunk.
+        activation_distance: Maximum distance from a ship to a chunk whose
+            bodies are kept in the space.
+    """
+
+    def __init__(self, space: 'pymunk.Space',
+                 bodies: 'Sequence[pymunk.Body]', chunk_size: float,
+                 activation_distance: float) -> None:
+
+        self.__space = space
+        self.__bodies = tuple(bodies)
+        self.__shapes = tuple(tuple(body.shapes) for body in self.__bodies)
+        self.__chunk_size = chunk_size
+        self.__chunk_radius = ceil(activation_distance/chunk_size)
+
+        self.__active_indexes = set(range(len(self.__bodies)))
+        self.__inactive_chunks = {}
+
+    @property
+    def active_indexes(self) -> 'AbstractSet[int]':
+        return self.__active_indexes
+
+    def __chunk(self, position):
+        chunk_size = self.__chunk_size
+        return floor(position[0]/chunk_size), floor(position[1]/chunk_size)
+
+    def update(self, positions: 'Iterable[Tuple[float, float]]') -> None:
+        """Move the bodies in or out of the space as the ships moved.
+
+        Args:
+            positions: Positions of the ships.
+        """
+
+        radius = self.__chunk_radius
+
+        active_chunks = set()
+        for position in positions:
+            chunk_x, chunk_y = self.__chunk(position)
+            active_chunks.update(
+                (x, y) for x in range(chunk_x - radius, chunk_x + radius + 1)
+                for y in range(chunk_y - radius, chunk_y + radius + 1))
+
+        bodies = self.__bodies
+        shapes = self.__shapes
+        inactive_chunks = self.__inactive_chunks
+
+        # The chunks of the active bodies are checked even if the ships
+        # didn't change chunk, since the bodies may have drifted out
+        removed_items = []
+        for i in tuple(self.__active_indexes):
+            body = bodies[i]
+            chunk = self.__chunk(body.position)
+
+            if chunk not in active_chunks:
+                self.__active_indexes.discard(i)
+                inactive_chunks.setdefault(chunk, []).append(i)
+                removed_items.append(body)
+                removed_items.extend(shapes[i])
+
+        added_items = []
+        for chunk in active_chunks.intersection(inactive_chunks):
+            for i in inactive_chunks.pop(chunk):
+                self.__active_indexes.add(i)
+                added_items.append(bodies[i])
+                added_items.extend(shapes[i])
+
+        # Removed bodies keep their position, angle and velocities, so they
+        # continue from the same state when added again
+        if removed_items:
+            self.__space.remove(*removed_items)
+        if added_items:
+            self.__space.add(*added_items)
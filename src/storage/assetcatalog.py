@@ -0,0 +1,118 @@
+import os
+import time
+from pathlib import PurePath
+from threading import Lock
+
+class AssetCatalog:
+    """In-memory index of the files inside a directory tree.
+
+    The index is built once and kept while the modification time of all the
+    indexed directories stays the same, these are checked at most once every
+    `check_interval` seconds, so lookups and listings don't touch the
+    filesystem most of the time.
+
+    Args:
+        base_path: Directory that will be indexed.
+        check_interval: Minimum time, in seconds, between two checks of the
+            directories modification times.
+    """
+
+    def __init__(self, base_path: 'pathlib.Path',
+                 check_interval: float = 1) -> None:
+
+        self.__base_path = base_path
+        self.__check_interval = check_interval
+        self.__lock = Lock()
+
+        self.__tree = None
+        self.__files = frozenset()
+        self.__dir_stamps = ()
+        self.__last_check = 0
+
+    def __scanDir(self, path, relative_path, files, dir_stamps):
+
+        dir_stamps.append((path, os.stat(path).st_mtime_ns))
+
+        tree = {}
+        with os.scandir(path) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+
+                entry_relative_path = relative_path + entry.name
+
+                if entry.is_dir():
+                    tree[entry.name] = self.__scanDir(
+                        entry.path, entry_relative_path + '/', files,
+                        dir_stamps)
+                elif entry.is_file():
+                    files.add(entry_relative_path)
+                    tree[entry.name] = None
+
+        return tree
+
+    def __isValid(self):
+
+        try:
+            return all(os.stat(path).st_mtime_ns == stamp
+                       for path, stamp in self.__dir_stamps)
+        except FileNotFoundError:
+            return False
+
+    def __update(self):
+
+        with self.__lock:
+            now = time.monotonic()
+
+            if self.__tree is not None and \
+                (now - self.__last_check < self.__check_interval or
+                 self.__isValid()):
+
+                self.__last_check = now
+                return
+
+            files = set()
+            dir_stamps = []
+
+            try:
+                tree = self.__scanDir(str(self.__base_path), '', files,
+                                      dir_stamps)
+            except FileNotFoundError:
+                tree = {}
+
+            self.__tree = tree
+            self.__files = frozenset(files)
+            self.__dir_stamps = tuple(dir_stamps)
+            self.__last_check = now
+
+    def invalidate(self) -> None:
+        with self.__lock:
+            self.__tree = None
+
+    def isFile(self, name: str) -> bool:
+        self.__update()
+        return PurePath(name).as_posix() in self.__files
+
+    def listTree(self, root: 'anytree.Node', blacklist: 'Container[str]' = (),
+                 remove_suffix: bool = True) -> 'anytree.Node':
+
+        self.__update()
+        self.__addNodes(self.__tree, root, blacklist, remove_suffix)
+
+        return root
+
+    @staticmethod
+    def __addNodes(tree, parent, blacklist, remove_suffix):
+
+        from anytree import Node # pylint: disable=import-outside-toplevel
+
+        for name, subtree in tree.items():
+
+            if name in blacklist:
+                continue
+
+            if subtree is None:
+                if remove_suffix is True:
+                    name = PurePath(name).stem
+                Node(name, parent=parent)
+            else:
+                AssetCatalog.__addNodes(subtree, Node(name, parent=parent),
+                                        blacklist, remove_suffix)
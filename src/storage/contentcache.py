@@ -0,0 +1,209 @@
+import os
+import pickle
+import tempfile
+from threading import Lock
+
+def _plainContent(content):
+
+    # Some parsers return dict subclasses that can't be pickled
+    if isinstance(content, dict):
+        return {key: _plainContent(value) for key, value in content.items()}
+
+    if isinstance(content, list):
+        return [_plainContent(value) for value in content]
+
+    return content
+
+class ContentCache:
+    """Cache of parsed configuration files.
+
+    The parsed content is kept pickled, so every call to `get` returns a new
+    copy that can be modified freely. An entry is valid while the file
+    modification time and size don't change.
+
+    Content built from multiple files, like the result of merging a file with
+    the files it inherits from, may be cached with `getDerived`, in this case
+    the entry is valid while none of the files used change and none of the
+    files that were missing, see `addMissing`, are created.
+
+    Args:
+        persist_path: File where the cache is saved by `save` and loaded from
+            when the cache is created, if None the cache is kept only in
+            memory.
+    """
+
+    def __init__(self, persist_path: 'Optional[pathlib.Path]' = None) -> None:
+
+        self.__persist_path = persist_path
+        self.__entries = {}
+        self.__derived_entries = {}
+        self.__compiled_entries = {}
+        self.__modified = False
+        self.__lock = Lock()
+
+        if persist_path is not None:
+            try:
+                with open(persist_path, 'rb') as file:
+                    self.__entries = pickle.load(file)
+            except Exception: # pylint: disable=broad-except
+                self.__entries = {}
+
+    @staticmethod
+    def __stamp(path):
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def __isValid(self, dependencies):
+        try:
+            return all(not os.path.exists(path) if stamp is None else
+                       self.__stamp(path) == stamp
+                       for path, stamp in dependencies)
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def addMissing(path: str, dependencies: 'List[Any]') -> None:
+        """Add to `dependencies` a file that must not exist.
+
+        Used for files that would have been used instead of the ones read, so
+        the derived content is built again when they are created.
+        """
+        dependencies.append((path, None))
+
+    def get(self, path: str,
+            parse_func: 'Callable[[str], Dict[str, Any]]',
+            dependencies: 'List[str]' = None) -> 'Dict[str, Any]':
+
+        stamp = self.__stamp(path)
+
+        if dependencies is not None:
+            dependencies.append(path)
+
+        entry = self.__entries.get(path)
+        if entry is not None and entry[0] == stamp:
+            return pickle.loads(entry[1])
+
+        content = _plainContent(parse_func(path))
+
+        with self.__lock:
+            self.__entries[path] = (
+                stamp, pickle.dumps(content, pickle.HIGHEST_PROTOCOL))
+            self.__modified = True
+
+        return content
+
+    def getDerived(self, key: 'Hashable',
+                   build_func: 'Callable[[List[str]], Dict[str, Any]]') \
+                       -> 'Dict[str, Any]':
+        """Get content built from one or more files.
+
+        Args:
+            key: Identifies the content, it must include everything other
+                than the files content that changes the result.
+            build_func: Function that builds the content, it receives a list
+                where it must append the path of every file it used, passing
+                it as the `dependencies` argument of `get` does this.
+        """
+
+        entry = self.__derived_entries.get(key)
+        if entry is not None and self.__isValid(entry[0]):
+            return pickle.loads(entry[1])
+
+        used_paths = []
+        content = _plainContent(build_func(used_paths))
+
+        # The stamps of the parsed contents are used, so a file that changed
+        # while the content was being built invalidates it, missing files
+        # are added with a None stamp
+        dependencies = tuple(path if isinstance(path, tuple) else
+                             (path, self.__entries[path][0])
+                             for path in used_paths)
+
+        with self.__lock:
+            self.__derived_entries[key] = (
+                dependencies, pickle.dumps(content, pickle.HIGHEST_PROTOCOL))
+
+        return content
+
+    def exportDerived(self, keys: 'Iterable[Hashable]') \
+        -> 'List[Tuple[Hashable, Tuple[Tuple[str, Any], ...], bytes]]':
+        """Export derived contents so they can be imported in another process.
+
+        Returns:
+            List of tuples with the key, the files used with their stamps and
+            the pickled content, only keys present in the cache are exported.
+        """
+
+        with self.__lock:
+            return [(key, *self.__derived_entries[key]) for key in keys
+                    if key in self.__derived_entries]
+
+    def importDerived(
+            self,
+            entries: 'Iterable[Tuple[Hashable, Tuple[Tuple[str, Any], ...], '
+                     'bytes]]') -> None:
+
+        with self.__lock:
+            for key, dependencies, data in entries:
+                self.__derived_entries[key] = (dependencies, data)
+
+    @staticmethod
+    def fileStamp(path: str) -> 'Tuple[int, int]':
+        return ContentCache.__stamp(path)
+
+    def getCompiled(self, key: 'Hashable',
+                    build_func: 'Callable[[List[str]], Dict[str, Any]]',
+                    compile_func: 'Callable[[Dict[str, Any]], Any]') -> 'Any':
+        """Get an object compiled from content built from one or more files.
+
+        The content is obtained as in `getDerived` and given to `compile_func`,
+        the compiled object is kept while the files used don't change.
+
+        Note:
+            The same compiled object is returned every time, so it must not be
+            modified.
+        """
+
+        entry = self.__compiled_entries.get(key)
+        if entry is not None and self.__isValid(entry[0]):
+            return entry[1]
+
+        content = self.getDerived(key, build_func)
+        dependencies, _ = self.__derived_entries[key]
+
+        compiled = compile_func(content)
+
+        with self.__lock:
+            self.__compiled_entries[key] = (dependencies, compiled)
+
+        return compiled
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__derived_entries.clear()
+            self.__compiled_entries.clear()
+            self.__modified = True
+
+    def save(self) -> None:
+
+        if self.__persist_path is None or self.__modified is False:
+            return
+
+        with self.__lock:
+            entries = dict(self.__entries)
+            self.__modified = False
+
+        cache_dir = self.__persist_path.parent
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # The file is replaced atomically so other processes never read a
+        # partially written cache
+        fd, temp_path = tempfile.mkstemp(dir=str(cache_dir))
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                pickle.dump(entries, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, str(self.__persist_path))
+        except Exception:
+            os.unlink(temp_path)
+            raise
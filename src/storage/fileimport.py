@@ -0,0 +1,152 @@
+import os
+import stat
+import shutil
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+def fileHash(path: 'pathlib.Path') -> str:
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+def __tempPath(path: 'pathlib.Path') -> 'pathlib.Path':
+    return path.with_name(
+        f'.{path.name}.{os.getpid()}.{threading.get_ident()}')
+
+def __storeBlob(src_path, blob_path):
+
+    # Blobs are named by the hash of their content, they are trusted if the
+    # size matches instead of being hashed again
+    try:
+        exists = True
+        if os.stat(blob_path).st_size == os.stat(src_path).st_size:
+            return
+    except FileNotFoundError:
+        exists = False
+
+    temp_blob_path = __tempPath(blob_path)
+    shutil.copyfile(src_path, temp_blob_path)
+
+    try:
+        if exists:
+            os.replace(temp_blob_path, blob_path)
+        else:
+            # Only one of the threads storing the same content creates it,
+            # so the files linked before by the others keep sharing it
+            os.link(temp_blob_path, blob_path)
+    except FileExistsError:
+        pass
+    finally:
+        try:
+            os.unlink(temp_blob_path)
+        except FileNotFoundError:
+            pass
+
+def __linkBlob(src_path, blob_path, mode, temp_dest_path):
+
+    # A blob removed by `collectBlobs` of another process between being
+    # stored and linked is stored again
+    for _ in range(2):
+        __storeBlob(src_path, blob_path)
+        os.chmod(blob_path, mode)
+        try:
+            os.link(blob_path, temp_dest_path)
+            return
+        except FileNotFoundError:
+            continue
+
+    os.link(blob_path, temp_dest_path)
+
+def __importFile(src_path: 'pathlib.Path', dest_path: 'pathlib.Path',
+                 mode: int, blob_dir: 'pathlib.Path') -> bool:
+
+    # Linked files are read-only, so a file edited in place can't change the
+    # others with the same content, see `unshareFile`. The mode is part of
+    # the blob name because hard links share it
+    mode &= ~0o222
+    blob_path = blob_dir.joinpath(f'{fileHash(src_path)}-{mode:o}')
+
+    try:
+        if os.path.samefile(dest_path, blob_path):
+            return False
+    except FileNotFoundError:
+        pass
+
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+    temp_dest_path = __tempPath(dest_path)
+    try:
+        __linkBlob(src_path, blob_path, mode, temp_dest_path)
+    except OSError:
+        # File systems without hard links get a writable copy instead
+        shutil.copyfile(src_path, temp_dest_path)
+        os.chmod(temp_dest_path, mode | 0o200)
+
+    os.replace(temp_dest_path, dest_path)
+
+    return True
+
+def unshareFile(path: 'pathlib.Path') -> None:
+    """Replace an imported file by a writable copy of its own.
+
+    Imported files with the same content are read-only hard links to the
+    same blob, they must be unshared before being edited.
+    """
+
+    file_stat = os.stat(path)
+    if file_stat.st_nlink == 1 and file_stat.st_mode & 0o200:
+        return
+
+    temp_path = __tempPath(path)
+    shutil.copyfile(path, temp_path)
+    os.chmod(temp_path, stat.S_IMODE(file_stat.st_mode) | 0o200)
+    os.replace(temp_path, path)
+
+def collectBlobs(blob_dir: 'pathlib.Path') -> int:
+    """Remove the stored contents that no imported file links anymore.
+
+    Returns:
+        Number of contents removed.
+    """
+
+    removed_count = 0
+    for blob_path in blob_dir.iterdir():
+        if blob_path.name.startswith('.'):
+            continue
+
+        if blob_path.stat().st_nlink == 1:
+            blob_path.unlink()
+            removed_count += 1
+
+    return removed_count
+
+def importFiles(files: 'Iterable[Tuple[pathlib.Path, pathlib.Path, int]]',
+                blob_dir: 'pathlib.Path', max_workers: int = None) -> int:
+    """Import files, storing each distinct content only once.
+
+    Each file is hashed and stored in `blob_dir`, the destination becomes a
+    read-only hard link to the stored content, so identical files in
+    different packages use the disk space only once and destinations that
+    already have the same content are left untouched. The files are imported
+    in parallel.
+
+    Args:
+        files: Tuples of source path, destination path and destination mode,
+            the destination is made read-only.
+        blob_dir: Directory where the contents are stored.
+        max_workers: Maximum number of threads used.
+
+    Returns:
+        Number of destination files that were created or modified.
+    """
+
+    blob_dir.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return sum(executor.map(
+            lambda file: __importFile(*file, blob_dir), files))
@@ -1,23 +1,27 @@
 
 import os
-import shutil
+import atexit
+from fnmatch import fnmatch
 from pathlib import Path
 import subprocess
 from enum import Enum
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
 from collections import namedtuple
 
 import json
-import toml
-import yaml
+import importlib.util
 
-from PyQt5 import uic
-
-from anytree import Node
+from . import (
+    configfileinheritance, configfilevariables, fileimport, scenariobundle
+)
 
-from . import configfileinheritance, configfilevariables
+from .contentcache import ContentCache
+from .assetcatalog import AssetCatalog
 
 from .loaders import (
-    shiploader, scenarioloader, controllerloader, objectloader
+    shiploader, scenarioloader, controllerloader, objectloader,
+    objectfieldloader
 )
 
 from ..utils import dictutils
@@ -25,9 +29,16 @@ from ..utils import dictutils
 class FileInfo:
 
     __instance = None
+    __initialized = False
+    __init_lock = Lock()
+    __content_cache = None
+    __suffix_cache = {}
+    __catalogs = {}
+    __loaded_bundles = {}
 
     FileDataType = Enum('FileDataType', ('CONTROLLER', 'SHIPMODEL', 'SCENARIO',
-                                         'OBJECTMODEL', 'IMAGE', 'UIDESIGN'))
+                                         'OBJECTMODEL', 'IMAGE', 'UIDESIGN',
+                                         'OBJECTFIELD'))
 
     __DataTypeInfoType = namedtuple('DataTypeInfoType',
                                     ('path', 'use_dist_path', 'suffix_list',
@@ -54,21 +65,37 @@ class FileInfo:
             'images', False, None, False, (),
             ('*.gif', '*.png'), 0o644),
         FileDataType.UIDESIGN: __DataTypeInfoType(
-            'forms', True, ('.ui',), True, (), None, None)
+            'forms', True, ('.ui',), True, (), None, None),
+        FileDataType.OBJECTFIELD: __DataTypeInfoType(
+            'objectfields', False, None, False, (),
+            ('*.csv', '*.npy'), 0o644)
     }
 
     def __init__(self):
-        self.__path = \
-            Path.home().joinpath('.local/share/spaceshipcontrol').resolve()
-        self.__dist_data_path = Path(__file__).parent.parent.resolve()
 
-        if self.__dist_data_path.name == 'src':
-            self.__dist_data_path = self.__dist_data_path.parent
+        # FileInfo is a singleton but __init__ is called every time FileInfo()
+        # is used, the data directory only needs to be set up once
+        with FileInfo.__init_lock:
+            if FileInfo.__initialized is True:
+                return
+
+            self.__path = \
+                Path.home().joinpath('.local/share/spaceshipcontrol').resolve()
+            self.__dist_data_path = Path(__file__).parent.parent.resolve()
+
+            if self.__dist_data_path.name == 'src':
+                self.__dist_data_path = self.__dist_data_path.parent
+
+            self.__setupDataDirectory()
+
+            FileInfo.__initialized = True
+
+    def __setupDataDirectory(self):
 
         self.__path.mkdir(parents=True, exist_ok=True)
 
         create_n_link_example_dirs = ['controllers', 'ships', 'scenarios',
-                                      'objects', 'images']
+                                      'objects', 'images', 'objectfields']
 
         dist_data_examples_path = self.__dist_data_path.joinpath('examples')
 
@@ -76,47 +103,73 @@ class FileInfo:
             path = self.__path.joinpath(dirname)
             path.mkdir(exist_ok=True)
 
-            example_dir_path = path.joinpath('examples')
+            self.__updateSymlink(dist_data_examples_path.joinpath(dirname),
+                                 path.joinpath('examples'))
+
+    @staticmethod
+    def __updateSymlink(target, link_path):
+
+        try:
+            if os.readlink(link_path) == str(target):
+                return
+        except OSError:
+            pass
+
+        # The link is created with a name unique to this process and renamed,
+        # so processes starting at the same time never see a missing link,
+        # it is renamed in the same directory so the rename is atomic
+        temp_link_path = link_path.with_name(
+            f'.{link_path.name}.{os.getpid()}')
+
+        try:
+            os.unlink(temp_link_path)
+        except FileNotFoundError:
+            pass
+
+        try:
+            os.symlink(target, temp_link_path)
+            os.replace(temp_link_path, link_path)
+        finally:
+            # Left only if the link couldn't be renamed
             try:
-                os.unlink(example_dir_path)
+                os.unlink(temp_link_path)
             except FileNotFoundError:
                 pass
-            os.symlink(dist_data_examples_path.joinpath(dirname),
-                       example_dir_path)
 
     def __new__(cls):
-        if FileInfo.__instance is None:
-            FileInfo.__instance = super().__new__(cls)
+        with FileInfo.__init_lock:
+            if FileInfo.__instance is None:
+                FileInfo.__instance = super().__new__(cls)
 
         return FileInfo.__instance
 
     def listFilesTree(self, filedatatype):
 
+        from anytree import Node # pylint: disable=import-outside-toplevel
+
         filedatatype_info = self.__getFileDataTypeInfo(filedatatype)
 
-        return self.__listTree(
-            self.getPath(filedatatype),
+        return self.__catalog(filedatatype).listTree(
             Node(filedatatype_info.path),
             remove_suffix=filedatatype_info.list_remove_suffix,
             blacklist=filedatatype_info.list_blacklist)
 
-    def __listTree(self, base_path, current_node, blacklist=(),
-                   remove_suffix=True):
+    def __catalog(self, filedatatype):
 
-        for path in sorted(base_path.iterdir()):
+        catalog = FileInfo.__catalogs.get(filedatatype)
 
-            if path.name in blacklist:
-                continue
+        if catalog is None:
+            catalog = AssetCatalog(self.getPath(filedatatype))
+            FileInfo.__catalogs[filedatatype] = catalog
 
-            if remove_suffix is True:
-                path = path.with_suffix('')
+        return catalog
 
-            new_node = Node(path.name, parent=current_node)
-            if path.is_dir():
-                self.__listTree(path, new_node, blacklist=blacklist,
-                                remove_suffix=remove_suffix)
+    @staticmethod
+    def __filesAdded():
 
-        return current_node
+        FileInfo.__suffix_cache.clear()
+        for catalog in FileInfo.__catalogs.values():
+            catalog.invalidate()
 
     def addScenarios(self, files):
         return self.addFiles(self.FileDataType.SCENARIO, files)
@@ -133,6 +186,18 @@ class FileInfo:
     def addImages(self, files):
         return self.addFiles(self.FileDataType.IMAGE, files)
 
+    def addObjectFields(self, files):
+        return self.addFiles(self.FileDataType.OBJECTFIELD, files)
+
+    def __contentCache(self):
+
+        if FileInfo.__content_cache is None:
+            FileInfo.__content_cache = ContentCache(
+                persist_path=self.__path.joinpath('cache/configs.pickle'))
+            atexit.register(FileInfo.__content_cache.save)
+
+        return FileInfo.__content_cache
+
     def addFiles(self, filedatatype, files):
 
         filedatatype_info = self.__getFileDataTypeInfo(filedatatype)
@@ -140,8 +205,12 @@ class FileInfo:
         if filedatatype_info.files_mode is None:
             raise ValueError('Can\'t add files to this FileDataType')
 
-        return self.__addFiles(self.getPath(filedatatype), files,
-                               mode=filedatatype_info.files_mode)
+        dest_dir_path = self.getPath(filedatatype)
+        mode = filedatatype_info.files_mode
+
+        return self.__importFiles(
+            (Path(file), dest_dir_path.joinpath(Path(file).name), mode)
+            for file in files)
 
     def addPackage(self, package_pathname):
 
@@ -149,28 +218,41 @@ class FileInfo:
 
         package_name = package_path.name
 
+        files = []
         for directory, mode, patterns in (
                 ('scenarios', 0o644, ('*.toml', '*.json', '*.yml', '*.yaml')),
                 ('ships', 0o644, ('*.toml', '*.json', '*.yml', '*.yaml')),
                 ('objects', 0o644, ('*.toml', '*.json', '*.yml', '*.yaml')),
                 ('controllers', 0o555, ('*',)),
-                ('images', 0o644, ('*.png', '*.gif'))):
+                ('images', 0o644, ('*.png', '*.gif')),
+                ('objectfields', 0o644, ('*.csv', '*.npy'))):
 
             dest_base_path = self.__path.joinpath(directory).joinpath(
                 package_name)
             package_subdir_path = package_path.joinpath(directory)
 
-            for pat in patterns:
-                for path in package_subdir_path.rglob(pat):
-                    if path.is_file():
+            for path in package_subdir_path.rglob('*'):
+                if path.is_file() and any(fnmatch(path.name, pat)
+                                          for pat in patterns):
+
+                    files.append((path, dest_base_path.joinpath(
+                        path.relative_to(package_subdir_path)), mode))
 
-                        dest_path = dest_base_path.joinpath(
-                            path.parent.relative_to(package_subdir_path))
+        return self.__importFiles(files)
 
-                        if not dest_path.exists():
-                            dest_path.mkdir(parents=True)
+    def __importFiles(self, files):
 
-                        self.__addFiles(dest_path, (path,), mode=mode)
+        blob_dir = self.__path.joinpath('blobs')
+
+        modified_count = fileimport.importFiles(files, blob_dir)
+
+        # Contents no imported file links anymore, because the files were
+        # replaced or unshared, are not kept
+        fileimport.collectBlobs(blob_dir)
+
+        self.__filesAdded()
+
+        return modified_count
 
     def __findSuffix(self, basename, filedatatype, valid_suffixes):
 
@@ -181,28 +263,82 @@ class FileInfo:
 
         return None, None
 
-    def __getContent(self, basename, filedatatype, inexistent_message):
+    @staticmethod
+    def __parseFile(filepath):
 
-        filepath, suffix = self.__findSuffix(
-            basename, filedatatype, ('.toml', '.json', '.yaml', '.yml'))
+        # pylint: disable=import-outside-toplevel
 
-        if filepath is None:
-            raise Exception(inexistent_message.format(name=basename))
+        suffix = Path(filepath).suffix
 
         if suffix == '.json':
             with open(filepath) as file:
                 return json.load(file)
 
         if suffix in ('.yaml', '.yml'):
+            import yaml
             with open(filepath) as file:
                 return yaml.safe_load(file)
 
+        import toml
         return toml.load(filepath)
 
-    def __getScenarioContent(self, scenario_name):
+    def __getContent(self, basename, filedatatype, inexistent_message,
+                     dependencies=None):
+
+        content_cache = self.__contentCache()
+
+        # The suffix found before is tried first, so the file is not looked
+        # for with every valid suffix again
+        cache_key = (filedatatype, basename)
+        cached = FileInfo.__suffix_cache.get(cache_key)
+        if cached is not None:
+            filepath, suffix = cached
+            try:
+                content = content_cache.get(filepath, self.__parseFile,
+                                            dependencies=dependencies)
+            except FileNotFoundError:
+                FileInfo.__suffix_cache.pop(cache_key, None)
+            else:
+                self.__addMissingSuffixes(basename, filedatatype, suffix,
+                                          dependencies)
+                return content
+
+        filepath, suffix = self.__findSuffix(
+            basename, filedatatype, self.__CONF_FILE_SUFFIX_LIST)
+
+        if filepath is None:
+            raise Exception(inexistent_message.format(name=basename))
+
+        FileInfo.__suffix_cache[cache_key] = (filepath, suffix)
+
+        content = content_cache.get(filepath, self.__parseFile,
+                                    dependencies=dependencies)
+        self.__addMissingSuffixes(basename, filedatatype, suffix, dependencies)
+
+        return content
+
+    def __addMissingSuffixes(self, basename, filedatatype, suffix,
+                             dependencies):
+
+        if dependencies is None:
+            return
+
+        # A file with a suffix of higher priority would be used instead, so
+        # contents derived from this one must be built again if it's created
+        dir_path = self.getPath(filedatatype)
+        for missing_suffix in self.__CONF_FILE_SUFFIX_LIST:
+            if missing_suffix == suffix:
+                break
+
+            ContentCache.addMissing(
+                str(dir_path.joinpath(basename + missing_suffix)),
+                dependencies)
+
+    def __getScenarioContent(self, scenario_name, dependencies=None):
 
         content = self.__getContent(scenario_name, self.FileDataType.SCENARIO,
-                                    'Inexistent scenario named \'{name}\'')
+                                    'Inexistent scenario named \'{name}\'',
+                                    dependencies=dependencies)
 
         dictutils.mergeMatch(content, (), ('Ship', 'ships'), 'Ship',
                              absolute=True)
@@ -213,10 +349,11 @@ class FileInfo:
 
         return content
 
-    def __getShipContent(self, ship_model, variables=None):
+    def __getShipContent(self, ship_model, variables=None, dependencies=None):
 
         content = self.__getContent(ship_model, self.FileDataType.SHIPMODEL,
-                                    'Inexistent ship model named \'{name}\'')
+                                    'Inexistent ship model named \'{name}\'',
+                                    dependencies=dependencies)
 
         dictutils.mergeMatch(content, (), ('Shape', 'shapes'), 'Shape',
                              absolute=True)
@@ -235,10 +372,11 @@ class FileInfo:
 
         return content
 
-    def __getObjectContent(self, object_model):
+    def __getObjectContent(self, object_model, dependencies=None):
 
         content = self.__getContent(object_model, self.FileDataType.OBJECTMODEL,
-                                    'Inexistent object model named \'{name}\'')
+                                    'Inexistent object model named \'{name}\'',
+                                    dependencies=dependencies)
 
         dictutils.mergeMatch(content, (), ('Shape', 'shapes'), 'Shape',
                              absolute=True)
@@ -249,44 +387,321 @@ class FileInfo:
 
         return content
 
+    @staticmethod
+    def __mergedContentKey(filedatatype, name, **kwargs):
+        return (filedatatype.name, name,
+                json.dumps(kwargs, sort_keys=True, default=str))
+
+    def __getMergedContent(self, filedatatype, name, get_content_func,
+                           compile_func=None, **kwargs):
+
+        prefixes = name.split('/')[:-1]
+
+        def build(dependencies):
+
+            content = get_content_func(name, dependencies=dependencies,
+                                       **kwargs)
+
+            return configfileinheritance.mergeInheritedFiles(
+                content, lambda parent_name: get_content_func(
+                    parent_name, dependencies=dependencies),
+                prefixes=prefixes)
+
+        # Merging files modifies them, so the cache gives back a copy of the
+        # merged content and the cached parents are never changed
+        cache_key = self.__mergedContentKey(filedatatype, name, **kwargs)
+
+        if compile_func is None:
+            return self.__contentCache().getDerived(cache_key, build), prefixes
+
+        return self.__contentCache().getCompiled(
+            cache_key, build,
+            lambda content: compile_func(content, prefixes=prefixes)), prefixes
+
+    @staticmethod
+    def __loadCompiledUi(compiled_path):
+
+        from PyQt5 import QtWidgets # pylint: disable=import-outside-toplevel
+
+        spec = importlib.util.spec_from_file_location(compiled_path.stem,
+                                                      str(compiled_path))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        form_class = next(value for name, value in vars(module).items()
+                          if name.startswith('Ui_'))
+
+        return form_class, getattr(QtWidgets, module.BASE_CLASS_NAME)
+
     def loadUi(self, filename):
-        return uic.loadUiType(
-            self.getPath(self.FileDataType.UIDESIGN, filename))
 
-    def loadScenario(self, scenario_name):
+        ui_path = self.getPath(self.FileDataType.UIDESIGN, filename,
+                               to_string=False)
+
+        # Forms compiled by 'setup.py compile_forms' are used if they are
+        # not older than the .ui file
+        compiled_path = ui_path.with_name(f'{ui_path.stem}_ui.py')
+        try:
+            if compiled_path.stat().st_mtime_ns >= ui_path.stat().st_mtime_ns:
+                return self.__loadCompiledUi(compiled_path)
+        except FileNotFoundError:
+            pass
+
+        from PyQt5 import uic # pylint: disable=import-outside-toplevel
+
+        return uic.loadUiType(str(ui_path))
+
+    def loadPixmap(self, image_name, width=None, height=None, angle=0,
+                   disk_cache=False):
+
+        from . import imagecache # pylint: disable=import-outside-toplevel
+
+        image_path = self.getPath(self.FileDataType.IMAGE, image_name)
+
+        if image_path is None:
+            raise Exception(f'Inexistent image named \'{image_name}\'')
+
+        cache_dir = self.__path.joinpath('cache/images') if disk_cache else None
 
-        prefixes = scenario_name.split('/')[:-1]
+        return imagecache.loadPixmap(image_path, width=width, height=height,
+                                     angle=angle, cache_dir=cache_dir)
 
-        scenario_content = self.__getScenarioContent(scenario_name)
+    def __bundlePath(self, scenario_name):
+        return self.__path.joinpath('cache/bundles', f'{scenario_name}.bundle')
 
-        scenario_content = configfileinheritance.mergeInheritedFiles(
-            scenario_content, self.__getScenarioContent, prefixes=prefixes)
+    def __loadScenarioBundle(self, scenario_name):
+
+        bundle_path = self.__bundlePath(scenario_name)
+
+        try:
+            bundle_stamp = ContentCache.fileStamp(str(bundle_path))
+        except FileNotFoundError:
+            return
+
+        if FileInfo.__loaded_bundles.get(bundle_path) == bundle_stamp:
+            return
+
+        entries = scenariobundle.loadBundle(bundle_path)
+        if entries is not None:
+            self.__contentCache().importDerived(entries)
+
+        FileInfo.__loaded_bundles[bundle_path] = bundle_stamp
+
+    @staticmethod
+    def __scenarioShipModels(scenario_info):
+
+        ship_models = {}
+        for ship_info in scenario_info.ships:
+
+            if isinstance(ship_info.model, tuple):
+                models = ship_info.model
+            elif ship_info.model is not None:
+                models = (ship_info.model,)
+            else:
+                models = ()
+
+            for model in models:
+                key = (model, json.dumps(ship_info.variables, sort_keys=True))
+                ship_models[key] = (model, ship_info.variables)
+
+        return tuple(ship_models.values())
+
+    def scenarioSpawnables(self, scenario_info):
+        """Get the object models that may be spawned in a scenario.
+
+        These are the models declared as spawnable by the scenario, followed
+        by the models of its emitters and of the launchers of its ships, which
+        get an empty pool if they are not declared. Static models can't be
+        spawned.
+        """
+
+        spawnables = {spawnable.model: spawnable
+                      for spawnable in scenario_info.spawnables}
+
+        models = [emitter.model for emitter in scenario_info.emitters]
+        for model, variables in self.__scenarioShipModels(scenario_info):
+            models.extend(sorted(shiploader.launcherModels(
+                self.loadShipBlueprint(model, variables))))
+
+        for model in models:
+            if model not in spawnables:
+                spawnables[model] = scenarioloader.SpawnableInfo(
+                    model, capacity=0, max_count=None)
+
+        for model in spawnables:
+            if objectloader.isStatic(self.loadObjectBlueprint(model)):
+                raise Exception(
+                    f'Static object model \'{model}\' can\'t be spawned')
+
+        return tuple(spawnables.values())
+
+    def __preloadSpawnables(self, scenario_info):
+
+        for spawnable in self.scenarioSpawnables(scenario_info):
+            self.loadObjectBlueprint(spawnable.model)
+
+    def __preloadObjectField(self, field_info):
+
+        for model in {obj_info.model for obj_info in
+                      self.loadObjectField(field_info)}:
+            self.loadObjectBlueprint(model)
+
+    def preloadScenario(self, scenario_name, progress_func=None,
+                        max_workers=None):
+        """Load a scenario and compile the models it uses in parallel.
+
+        After this, loading the ships and objects of the scenario only builds
+        them from the compiled models. It may be called from any thread.
+
+        Args:
+            progress_func: Called with the number of finished and total tasks
+                every time a task finishes, from the thread that ran it.
+        """
+
+        scenario_info = self.loadScenario(scenario_name)
+
+        tasks = [(self.loadShipBlueprint, model, variables) for model, variables
+                 in self.__scenarioShipModels(scenario_info)]
+        tasks.extend((self.loadObjectBlueprint, model) for model in
+                     {obj_info.model for obj_info in scenario_info.objects
+                      if obj_info.model is not None})
+        tasks.extend((self.__preloadObjectField, field_info)
+                     for field_info in scenario_info.object_fields)
+        tasks.append((self.__preloadSpawnables, scenario_info))
+
+        total = len(tasks) + 1
+        finished = [1]
+        finished_lock = Lock()
+
+        def taskDone(_future):
+            with finished_lock:
+                finished[0] += 1
+                count = finished[0]
+            progress_func(count, total)
+
+        if progress_func is not None:
+            progress_func(1, total)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(*task) for task in tasks]
+
+            if progress_func is not None:
+                for future in futures:
+                    future.add_done_callback(taskDone)
+
+            for future in futures:
+                future.result()
+
+        return scenario_info
+
+    def compileScenario(self, scenario_name):
+        """Save a bundle with everything needed to load a scenario.
+
+        The bundle has the scenario and all the ship and object models it uses
+        already merged with the files they inherit from, `loadScenario` uses it
+        while the files used to create it don't change.
+        """
+
+        scenario_info = self.loadScenario(scenario_name)
+
+        keys = [self.__mergedContentKey(self.FileDataType.SCENARIO,
+                                        scenario_name)]
+        images = [image.name for image in scenario_info.static_images]
+
+        for model, variables in self.__scenarioShipModels(scenario_info):
+
+            keys.append(self.__mergedContentKey(
+                self.FileDataType.SHIPMODEL, model, variables=variables))
+            images.extend(image.name for image in
+                          self.loadShipBlueprint(model, variables).images)
+
+        object_models = {obj_info.model for obj_info in scenario_info.objects
+                         if obj_info.model is not None}
+
+        for field_info in scenario_info.object_fields:
+            object_models.update(obj_info.model for obj_info in
+                                 self.loadObjectField(field_info))
+
+        object_models.update(spawnable.model for spawnable in
+                             self.scenarioSpawnables(scenario_info))
+
+        for model in sorted(object_models):
+
+            keys.append(self.__mergedContentKey(self.FileDataType.OBJECTMODEL,
+                                                model))
+            images.extend(image.name for image in
+                          self.loadObjectBlueprint(model).images)
+
+        # Images are not part of the bundle, they are loaded from their files
+        # anyway, but a scenario with missing images is not compiled
+        for image in images:
+            if self.getPath(self.FileDataType.IMAGE, image) is None:
+                raise Exception(f'Inexistent image named \'{image}\'')
+
+        bundle_path = self.__bundlePath(scenario_name)
+
+        scenariobundle.saveBundle(
+            bundle_path, self.__contentCache().exportDerived(keys))
+
+        return bundle_path
+
+    def loadScenario(self, scenario_name):
+
+        # A compiled bundle, if up to date, fills the cache so the scenario
+        # and its models are not parsed again
+        self.__loadScenarioBundle(scenario_name)
+
+        scenario_content, prefixes = self.__getMergedContent(
+            self.FileDataType.SCENARIO, scenario_name,
+            self.__getScenarioContent)
 
         return scenarioloader.loadScenario(scenario_content, prefixes=prefixes)
 
+    def loadShipBlueprint(self, model, variables=None):
+
+        # The ship model is compiled only once for each set of variables
+        ship_blueprint, _ = self.__getMergedContent(
+            self.FileDataType.SHIPMODEL, model, self.__getShipContent,
+            compile_func=shiploader.compileShip, variables=variables)
+
+        return ship_blueprint
+
     def loadShip(self, model, name, space, communication_engine=None,
                  variables=None):
 
-        prefixes = model.split('/')[:-1]
+        return shiploader.buildShip(self.loadShipBlueprint(model, variables),
+                                    name, space,
+                                    communication_engine=communication_engine)
+
+    def loadObjectBlueprint(self, model):
 
-        ship_content = self.__getShipContent(model, variables=variables)
+        obj_blueprint, _ = self.__getMergedContent(
+            self.FileDataType.OBJECTMODEL, model, self.__getObjectContent,
+            compile_func=objectloader.compileObject)
 
-        ship_content = configfileinheritance.mergeInheritedFiles(
-            ship_content, self.__getShipContent, prefixes=prefixes)
+        return obj_blueprint
 
-        return shiploader.loadShip(ship_content, name, space, prefixes=prefixes,
-                                   communication_engine=communication_engine)
+    def loadObject(self, model, space, pose=(0, 0, 0)):
+        objects = objectloader.buildObjects(self.loadObjectBlueprint(model),
+                                            (pose,), space)
+        return objects[0]
 
-    def loadObject(self, model, space):
+    def loadObjects(self, model, poses, space):
+        return objectloader.buildObjects(self.loadObjectBlueprint(model),
+                                         poses, space)
 
-        prefixes = model.split('/')[:-1]
+    def loadObjectField(self, field_info):
 
-        obj_content = self.__getObjectContent(model)
+        path = self.getPath(self.FileDataType.OBJECTFIELD, field_info.path)
 
-        obj_content = configfileinheritance.mergeInheritedFiles(
-            obj_content, self.__getObjectContent, prefixes=prefixes)
+        if path is None:
+            raise Exception(
+                f'Inexistent object field named \'{field_info.path}\'')
 
-        return objectloader.loadObject(obj_content, space, prefixes=prefixes)
+        columns = self.__contentCache().get(
+            path, objectfieldloader.parseObjectField)
+
+        return objectfieldloader.loadObjectField(columns, field_info)
 
     def loadController(self, controller_name, ship, json_info,
                        debug_queue, lock):
@@ -306,19 +721,19 @@ class FileInfo:
             path, _ = self.__findSuffix(filename, filedatatype, valid_suffixes)
 
         if path is not None:
+            # Imported files may share their content with others, they are
+            # opened to be edited so they get a copy of their own
+            try:
+                fileimport.unshareFile(path)
+            except OSError:
+                pass
+
             self.__openFile(path)
 
     @staticmethod
     def __openFile(path):
         subprocess.call(['xdg-open', path])
 
-    @staticmethod
-    def __addFiles(path, files, mode=0o644):
-        path_str = str(path)
-        for file in files:
-            new_file = shutil.copy(file, path_str)
-            os.chmod(new_file, mode)
-
     def getPath(self, filedatatype, name=None, to_string=True):
 
         if filedatatype is None:
@@ -338,11 +753,11 @@ class FileInfo:
         if name is None:
             return filepath
 
-        filepath = filepath.joinpath(name)
-
-        if not(filepath.exists() and filepath.is_file()):
+        if not self.__catalog(filedatatype).isFile(name):
             return None
 
+        filepath = filepath.joinpath(name)
+
         if to_string:
             return str(filepath)
         return filepath
@@ -0,0 +1,169 @@
+import os
+import json
+import hashlib
+from collections import OrderedDict
+
+from PyQt5.QtGui import QPixmap, QTransform
+
+# Most recently used pixmaps, by path and transformation, with the stamp of
+# the file they were loaded from
+__pixmaps = OrderedDict()
+__MAX_PIXMAPS = 256
+
+# Disk caches already pruned by this process, with the size of their images
+__disk_sizes = {}
+__MAX_DISK_SIZE = 64 << 20
+
+def __scalePixmap(pixmap: QPixmap, width: 'Optional[int]',
+                  height: 'Optional[int]') -> QPixmap:
+
+    if height is None:
+        if width is not None:
+            return pixmap.scaledToWidth(width)
+        return pixmap
+
+    if width is None:
+        return pixmap.scaledToHeight(height)
+
+    return pixmap.scaled(width, height)
+
+def __transformPixmap(path, width, height, angle):
+
+    pixmap = __scalePixmap(loadPixmap(path), width, height)
+
+    if angle != 0:
+        pixmap = pixmap.transformed(QTransform().rotate(angle))
+
+    return pixmap
+
+def __writeFile(path, write_func):
+
+    # Files are written with a name unique to this process and renamed, so
+    # other processes never read them partially written
+    temp_path = path.with_name(f'.{path.name}.{os.getpid()}')
+    try:
+        write_func(temp_path)
+        os.replace(temp_path, path)
+    finally:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+
+def __removeEntry(cache_path):
+    for path in (cache_path, cache_path.with_suffix('.json')):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+def __pruneDiskCache(cache_dir):
+
+    # Each image has a file with its source path and stamp next to it, so
+    # processes sharing the cache never overwrite each other's entries. The
+    # images whose source was removed are pruned, the others only when the
+    # cache is too large
+    images = []
+    for cache_path in cache_dir.glob('*.png'):
+        try:
+            with open(cache_path.with_suffix('.json')) as file:
+                source_path, _ = json.load(file)
+            if not os.path.exists(source_path):
+                __removeEntry(cache_path)
+                continue
+        except (OSError, ValueError):
+            pass
+
+        try:
+            cache_stat = cache_path.stat()
+        except FileNotFoundError:
+            continue
+
+        images.append((cache_stat.st_mtime_ns, cache_stat.st_size,
+                       cache_path))
+
+    # Least recently used images are removed when the cache is too large
+    size = sum(image_size for _, image_size, _ in images)
+    images.sort()
+    for _, image_size, cache_path in images:
+        if size <= __MAX_DISK_SIZE:
+            break
+        __removeEntry(cache_path)
+        size -= image_size
+
+    return size
+
+def __loadCachedPixmap(path, stamp, width, height, angle, cache_dir):
+
+    if cache_dir not in __disk_sizes:
+        __disk_sizes[cache_dir] = (__pruneDiskCache(cache_dir)
+                                   if cache_dir.is_dir() else 0)
+
+    # The name doesn't depend on the stamp, so an image cached from an older
+    # version of the file is replaced
+    name = hashlib.sha1(
+        repr((path, width, height, angle)).encode()).hexdigest()
+    cache_path = cache_dir.joinpath(name + '.png')
+    info_path = cache_dir.joinpath(name + '.json')
+
+    try:
+        with open(info_path) as file:
+            if json.load(file) == [path, stamp]:
+                pixmap = QPixmap(str(cache_path))
+                if not pixmap.isNull():
+                    # The modification time marks when it was last used
+                    os.utime(cache_path)
+                    return pixmap
+    except (OSError, ValueError):
+        pass
+
+    pixmap = __transformPixmap(path, width, height, angle)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    __writeFile(cache_path,
+                lambda temp_path: pixmap.save(str(temp_path), 'PNG'))
+    __writeFile(info_path,
+                lambda temp_path: temp_path.write_text(json.dumps(
+                    [path, stamp])))
+
+    __disk_sizes[cache_dir] += cache_path.stat().st_size
+    if __disk_sizes[cache_dir] > __MAX_DISK_SIZE:
+        __disk_sizes[cache_dir] = __pruneDiskCache(cache_dir)
+
+    return pixmap
+
+def loadPixmap(path: str, width: int = None, height: int = None,
+               angle: 'Union[int, float]' = 0,
+               cache_dir: 'Optional[pathlib.Path]' = None) -> QPixmap:
+
+    path = str(path)
+    stamp = os.stat(path).st_mtime_ns
+
+    key = (path, width, height, angle)
+
+    cached = __pixmaps.get(key)
+    if cached is not None and cached[0] == stamp:
+        __pixmaps.move_to_end(key)
+        return cached[1]
+
+    if width is None and height is None and angle == 0:
+        pixmap = QPixmap(path)
+
+    elif cache_dir is None:
+        pixmap = __transformPixmap(path, width, height, angle)
+
+    else:
+        pixmap = __loadCachedPixmap(path, stamp, width, height, angle,
+                                    cache_dir)
+
+    # A pixmap loaded from an older version of the file is replaced
+    __pixmaps[key] = (stamp, pixmap)
+    __pixmaps.move_to_end(key)
+
+    if len(__pixmaps) > __MAX_PIXMAPS:
+        __pixmaps.popitem(last=False)
+
+    return pixmap
+
+def clear() -> None:
+    __pixmaps.clear()
@@ -0,0 +1,99 @@
+import csv
+from math import pi
+from pathlib import Path
+
+from ..configfileinheritance import resolvePrefix
+
+from .scenarioloader import ObjectInfo
+
+__COLUMNS = ('model', 'x', 'y', 'angle')
+
+def __parseCsv(path):
+
+    with open(path, newline='') as file:
+        reader = csv.DictReader(file)
+
+        columns = {name: [] for name in reader.fieldnames or ()
+                   if name in __COLUMNS}
+
+        for row in reader:
+            for name, values in columns.items():
+                values.append(row[name])
+
+    for name in ('x', 'y', 'angle'):
+        values = columns.get(name)
+        if values is not None:
+            columns[name] = [float(value) if value else 0 for value in values]
+
+    return columns
+
+def __parseNpy(path):
+
+    try:
+        import numpy # pylint: disable=import-outside-toplevel
+    except ImportError:
+        raise Exception('NumPy is needed to load \'.npy\' object fields')
+
+    array = numpy.load(path, allow_pickle=False)
+
+    # Structured arrays have named columns, other arrays have the columns x, y
+    # and, optionally, angle
+    if array.dtype.names is not None:
+        return {name: array[name].tolist() for name in array.dtype.names
+                if name in __COLUMNS}
+
+    if array.ndim != 2 or array.shape[1] not in (2, 3):
+        raise Exception('Object field arrays must have 2 or 3 columns')
+
+    return {name: array[:, i].tolist()
+            for i, name in enumerate(('x', 'y', 'angle')[:array.shape[1]])}
+
+def parseObjectField(path: str) -> 'Dict[str, List[Any]]':
+    """Read the columns of an object field file.
+
+    CSV files must have a header naming the columns, `.npy` files are read
+    with NumPy, which is only needed for them.
+
+    Returns:
+        Dict with the columns found among model, x, y and angle.
+    """
+
+    suffix = Path(path).suffix
+
+    if suffix == '.csv':
+        columns = __parseCsv(path)
+    elif suffix == '.npy':
+        columns = __parseNpy(path)
+    else:
+        raise Exception(f'Invalid object field file type \'{suffix}\'')
+
+    if 'x' not in columns or 'y' not in columns:
+        raise Exception('Object fields must have the columns x and y')
+
+    return columns
+
+def loadObjectField(columns: 'Dict[str, List[Any]]',
+                    field_info: 'ObjectFieldInfo') -> 'Tuple[ObjectInfo, ...]':
+
+    count = len(columns['x'])
+
+    models = columns.get('model', (None,)*count)
+    angles = columns.get('angle', (0,)*count)
+
+    # Fields usually have a few models repeated many times
+    resolved_models = {}
+    for model in set(models):
+
+        if not model:
+            resolved_model = field_info.model
+            if resolved_model is None:
+                raise ValueError('Object field without model')
+        else:
+            resolved_model, _ = resolvePrefix(model, field_info.prefixes)
+
+        resolved_models[model] = resolved_model
+
+    return tuple(ObjectInfo(model=resolved_models[model], position=(x, y),
+                            angle=pi*angle/180)
+                 for model, x, y, angle in zip(models, columns['x'],
+                                               columns['y'], angles))
@@ -1,45 +1,131 @@
-
+from math import pi
 from collections import namedtuple
 
 from pymunk import Body
 
-from .shapeloader import loadShapes
+from .shapeloader import compileShapes, buildShapes
 from .imageloader import loadImages
 
-ObjectInfo = namedtuple('ObjectInfo', ('body', 'images'))
+ObjectInfo = namedtuple('ObjectInfo', ('body', 'images', 'shapes'))
+
+ObjectBlueprint = namedtuple('ObjectBlueprint', ('shapes', 'body_type', 'mass',
+                                                 'moment', 'velocity',
+                                                 'angular_velocity', 'images'))
+
+__BODY_TYPES = {
 
-def loadObject(obj_info: str, space: 'pymunk.Space',
-               prefixes: 'Sequence[str]' = ()) \
-    -> 'Tuple[Structure, Sequence[QWidget]]':
+    'dynamic': Body.DYNAMIC,
+    'kinematic': Body.KINEMATIC,
+    'static': Body.STATIC
+}
 
-    config_content = obj_info.get('Config', {})
+def compileObject(obj_info: 'Dict[str, Any]',
+                  prefixes: 'Sequence[str]' = ()) -> ObjectBlueprint:
+
+    config_content = obj_info.get('Config')
 
     if config_content is None:
-        is_static = False
+        config_content = {}
+
+    # 'static' is kept for models written before body_type existed
+    if config_content.get('static', False) is True:
+        default_body_type = 'static'
     else:
-        is_static = config_content.get('static', False)
+        default_body_type = 'dynamic'
+
+    body_type_name = config_content.get('body_type', default_body_type)
+    body_type = __BODY_TYPES.get(body_type_name)
 
-    shapes = loadShapes(obj_info['Shape'])
+    if body_type is None:
+        raise Exception(f'Invalid body type \'{body_type_name}\'')
 
-    if is_static is True:
+    velocity_content = config_content.get('Velocity', {})
+    velocity = (velocity_content.get('x', 0), velocity_content.get('y', 0))
+    angular_velocity = pi*config_content.get('angular_velocity', 0)/180
 
-        body = Body(body_type=Body.STATIC)
+    shapes = compileShapes(obj_info['Shape'])
 
-        for shape in shapes:
-            shape.body = body
+    # Shapes are created once to get the mass and moment pymunk computes
+    prototype_shapes = buildShapes(shapes)
+    mass = sum(shape.mass for shape in prototype_shapes)
+    moment = sum(shape.moment for shape in prototype_shapes)
 
-        space.add(shapes)
+    return ObjectBlueprint(shapes=shapes, body_type=body_type,
+                           mass=mass, moment=moment, velocity=velocity,
+                           angular_velocity=angular_velocity,
+                           images=tuple(loadImages(obj_info.get('Image', ()),
+                                                   prefixes=prefixes)))
 
+def isStatic(blueprint: ObjectBlueprint) -> bool:
+    return blueprint.body_type == Body.STATIC
+
+def buildBody(blueprint: ObjectBlueprint) \
+    -> 'Tuple[pymunk.Body, List[pymunk.Shape]]':
+    """Build the body of an object and its shapes, without adding them to a
+    space.
+
+    Static objects have no body of their own, so they can't be built with this.
+    """
+
+    if isStatic(blueprint):
+        raise Exception('Static objects have no body')
+
+    if blueprint.body_type == Body.KINEMATIC:
+        body = Body(body_type=Body.KINEMATIC)
+        body.velocity = blueprint.velocity
+        body.angular_velocity = blueprint.angular_velocity
     else:
-        mass = sum(shape.mass for shape in shapes)
-        moment = sum(shape.moment for shape in shapes)
+        body = Body(blueprint.mass, blueprint.moment)
+
+    return body, buildShapes(blueprint.shapes, body=body)
+
+def buildObjects(blueprint: ObjectBlueprint,
+                 poses: 'Iterable[Tuple[float, float, float]]',
+                 space: 'pymunk.Space') -> 'List[ObjectInfo]':
+    """Build an object for each pose and add all of them to the space at once.
+
+    The shapes of static objects are attached to the static body of the space
+    already in their place, so these objects have no body of their own and
+    `shapes` has shapes in the object coordinates to draw them. The static
+    shapes index of the space must be updated with `reindex_static`
+    afterwards.
+    """
+
+    objects = []
+    space_items = []
+
+    if blueprint.body_type == Body.STATIC:
+        model_shapes = buildShapes(blueprint.shapes)
+
+        for pose in poses:
+            space_items.extend(buildShapes(blueprint.shapes,
+                                           body=space.static_body, pose=pose))
+            objects.append(ObjectInfo(None, blueprint.images, model_shapes))
+
+        space.add(*space_items)
+
+        return objects
+
+    for x, y, angle in poses:
+
+        body, shapes = buildBody(blueprint)
+
+        body.position = x, y
+        body.angle = angle
+
+        space_items.append(body)
+        space_items.extend(shapes)
+        objects.append(ObjectInfo(body, blueprint.images, shapes))
+
+    space.add(*space_items)
 
-        body = Body(mass, moment)
+    return objects
 
-        for shape in shapes:
-            shape.body = body
+def loadObject(obj_info: 'Dict[str, Any]', space: 'pymunk.Space',
+               prefixes: 'Sequence[str]' = (),
+               pose: 'Tuple[float, float, float]' = (0, 0, 0)) -> ObjectInfo:
 
-        space.add(body, shapes)
+    objects = buildObjects(compileObject(obj_info, prefixes=prefixes),
+                           (pose,), space)
 
-    return ObjectInfo(body, loadImages(obj_info.get('Image', ()),
-                                       prefixes=prefixes))
+    return objects[0]
@@ -4,6 +4,8 @@ from collections import namedtuple
 
 from ..configfileinheritance import resolvePrefix
 
+from .shapeloader import collisionCategories
+
 from ...objectives.objective import ObjectiveGroup
 from ...objectives.gotoobjective import GoToObjective
 from ...objectives.timedobjective import TimedObjectiveGroup
@@ -15,17 +17,46 @@ StaticImageInfo = namedtuple('StaticImageInfo',
 
 ObjectInfo = namedtuple('ObjectInfo', ('model', 'position', 'angle'))
 
+ObjectFieldInfo = namedtuple('ObjectFieldInfo', ('path', 'model', 'prefixes'))
+
+SpawnableInfo = namedtuple('SpawnableInfo', ('model', 'capacity',
+                                             'max_count'))
+
+EmitterInfo = namedtuple('EmitterInfo', ('model', 'position', 'angle',
+                                         'speed', 'spread', 'interval',
+                                         'lifetime'))
+
 ShipInfo = namedtuple('ShipInfo', (
     'name', 'model', 'controller', 'position', 'angle', 'variables'))
 
 PhysicsEngineInfo = namedtuple('PhysicsEngineInfo',
                                ('damping', 'gravity', 'collision_slop',
-                                'collision_persistence', 'iterations'))
+                                'collision_persistence', 'iterations',
+                                'threads', 'spatial_hash',
+                                'sleep_time_threshold',
+                                'idle_speed_threshold', 'step_time',
+                                'max_substeps', 'max_displacement',
+                                'contact_substeps', 'gravity_field',
+                                'streaming'))
+
+StreamingInfo = namedtuple('StreamingInfo', ('chunk_size',
+                                             'activation_distance',
+                                             'update_interval'))
+
+GravityFieldInfo = namedtuple('GravityFieldInfo',
+                              ('sources', 'constant', 'softening', 'n_body',
+                               'cell_size', 'direct_limit'))
+
+RenderingInfo = namedtuple('RenderingInfo',
+                           ('index_items', 'static_background',
+                            'cull_offscreen', 'batch_ships',
+                            'batch_objects'))
 
 ScenarioInfo = namedtuple('ScenarioInfo', (
     'name', 'ships', 'objectives', 'objects', 'visible_user_interface',
     'communication_engine', 'visible_debug_window', 'static_images',
-    'physics_engine'
+    'physics_engine', 'rendering', 'object_fields', 'collision_matrix',
+    'spawnables', 'emitters'
 ))
 
 def __createGoToObjective(objective_content) -> 'GoToObjective':
@@ -119,6 +150,48 @@ def __readObjectInfo(obj_content, prefixes) -> 'ObjectInfo':
 
     return ObjectInfo(model=model, position=position, angle=angle)
 
+def __readObjectFieldInfo(field_content, prefixes) -> 'ObjectFieldInfo':
+
+    path, _ = resolvePrefix(field_content['path'], prefixes)
+
+    model = field_content.get('model')
+    if model is not None:
+        model = __resolveObjectModel(model, prefixes)
+
+    # The models in the field file are resolved with the scenario prefixes
+    return ObjectFieldInfo(path=path, model=model, prefixes=tuple(prefixes))
+
+def __resolveObjectModel(model, prefixes):
+
+    model_after, _ = resolvePrefix(model, prefixes)
+
+    if model_after is None:
+        raise ValueError(f'Object model not found \'{model}\'')
+
+    return model_after
+
+def __readSpawnableInfo(spawnable_content, prefixes) -> 'SpawnableInfo':
+
+    return SpawnableInfo(
+        model=__resolveObjectModel(spawnable_content['model'], prefixes),
+        capacity=spawnable_content.get('capacity', 0),
+        max_count=spawnable_content.get('max_count'))
+
+def __readEmitterInfo(emitter_content, prefixes) -> 'EmitterInfo':
+
+    interval = emitter_content.get('interval', 1)
+    if interval <= 0:
+        raise ValueError('The interval of an emitter must be positive')
+
+    return EmitterInfo(
+        model=__resolveObjectModel(emitter_content['model'], prefixes),
+        position=(emitter_content.get('x', 0), emitter_content.get('y', 0)),
+        angle=pi*emitter_content.get('angle', 0)/180,
+        speed=emitter_content.get('speed', 0),
+        spread=pi*emitter_content.get('spread', 0)/180,
+        interval=interval,
+        lifetime=emitter_content.get('lifetime'))
+
 def __readImageInfo(image_content, prefixes) -> 'StaticImageInfo':
 
     image_path = image_content['path']
@@ -130,6 +203,18 @@ def __readImageInfo(image_content, prefixes) -> 'StaticImageInfo':
                            x=image_content.get('x', 0),
                            y=image_content.get('y', 0))
 
+def loadGravityField(field_info: 'Dict[str, Any]') -> 'GravityFieldInfo':
+
+    sources = tuple(((source.get('x', 0), source.get('y', 0)), source['mass'])
+                    for source in field_info.get('Source', ()))
+
+    return GravityFieldInfo(sources=sources,
+                            constant=field_info.get('constant', 1),
+                            softening=field_info.get('softening', 1),
+                            n_body=field_info.get('n_body', False),
+                            cell_size=field_info.get('cell_size', 1000),
+                            direct_limit=field_info.get('direct_limit', 512))
+
 def loadPhysicsEngine(engine_info: 'Dict[str, Any]'):
 
     gravity_dict = engine_info.get('Gravity')
@@ -138,11 +223,80 @@ def loadPhysicsEngine(engine_info: 'Dict[str, Any]'):
     else:
         gravity = (0, 0)
 
+    spatial_hash_dict = engine_info.get('SpatialHash')
+    if spatial_hash_dict is not None:
+        spatial_hash = (spatial_hash_dict['dimension'],
+                        spatial_hash_dict.get('count', 1000))
+    else:
+        spatial_hash = None
+
+    threads = engine_info.get('threads', 1)
+    if threads not in (1, 2):
+        raise ValueError('The physics engine may only use 1 or 2 threads')
+
+    gravity_field_dict = engine_info.get('GravityField')
+    if gravity_field_dict is not None:
+        gravity_field = loadGravityField(gravity_field_dict)
+    else:
+        gravity_field = None
+
+    streaming_dict = engine_info.get('Streaming')
+    if streaming_dict is not None:
+        streaming = StreamingInfo(
+            streaming_dict.get('chunk_size', 1000),
+            streaming_dict.get('activation_distance', 2000),
+            streaming_dict.get('update_interval', 10))
+    else:
+        streaming = None
+
+    if engine_info.get('max_substeps', 1) < 1 or \
+        engine_info.get('contact_substeps', 1) < 1:
+        raise ValueError('The number of substeps must be at least 1')
+
     return PhysicsEngineInfo(engine_info.get('damping', 1),
                              gravity,
                              engine_info.get('collision_slop', 0.1),
                              engine_info.get('collision_persistence', 3),
-                             engine_info.get('iterations', 10))
+                             engine_info.get('iterations', 10),
+                             threads,
+                             spatial_hash,
+                             engine_info.get('sleep_time_threshold',
+                                             float('inf')),
+                             engine_info.get('idle_speed_threshold', 0),
+                             engine_info.get('step_time', 0.02),
+                             engine_info.get('max_substeps', 1),
+                             engine_info.get('max_displacement',
+                                             float('inf')),
+                             engine_info.get('contact_substeps', 1),
+                             gravity_field,
+                             streaming)
+
+def loadCollisionMatrix(matrix_info: 'Dict[str, Sequence[str]]') \
+    -> 'Tuple[Tuple[int, int], ...]':
+    """Load the categories each collision category may collide with.
+
+    Returns:
+        Tuples with the bit of a category and the mask of the categories
+        that shapes in it collide with.
+    """
+
+    return tuple((collisionCategories((name,)), collisionCategories(names))
+                 for name, names in matrix_info.items())
+
+def loadRendering(rendering_info: 'Dict[str, Any]'):
+
+    mode = rendering_info.get('mode', 'default')
+
+    if mode not in ('default', 'large-map'):
+        raise ValueError(f'Invalid rendering mode \'{mode}\'')
+
+    large_map = mode == 'large-map'
+
+    return RenderingInfo(rendering_info.get('index_items', not large_map),
+                         rendering_info.get('static_background', large_map),
+                         rendering_info.get('cull_offscreen', large_map),
+                         rendering_info.get('batch_ships', large_map),
+                         rendering_info.get('batch_objects', large_map))
 
 def loadCommunicationEngine(engine_info: 'Dict[str, Any]'):
 
@@ -168,9 +322,18 @@ def loadScenario(scenario_info: 'Dict[str, Any]',
     objects = tuple(__readObjectInfo(obj, prefixes)
                     for obj in scenario_info.get('Object', ()))
 
+    object_fields = tuple(__readObjectFieldInfo(field, prefixes)
+                          for field in scenario_info.get('ObjectField', ()))
+
     images = tuple(__readImageInfo(image, prefixes)
                    for image in scenario_info.get('Image', ()))
 
+    spawnables = tuple(__readSpawnableInfo(spawnable, prefixes)
+                       for spawnable in scenario_info.get('Spawnable', ()))
+
+    emitters = tuple(__readEmitterInfo(emitter, prefixes)
+                     for emitter in scenario_info.get('Emitter', ()))
+
     hidden_user_interface = scenario_content.get('hide_user_interface', False)
 
     comm_engine = loadCommunicationEngine(
@@ -181,6 +344,12 @@ def loadScenario(scenario_info: 'Dict[str, Any]',
                         visible_debug_window=scenario_content.get(
                             'debug', False),
                         communication_engine=comm_engine, objects=objects,
+                        object_fields=object_fields,
                         static_images=images,
                         physics_engine=loadPhysicsEngine(
-                            scenario_info.get('PhysicsEngine', {})))
+                            scenario_info.get('PhysicsEngine', {})),
+                        rendering=loadRendering(
+                            scenario_info.get('Rendering', {})),
+                        collision_matrix=loadCollisionMatrix(
+                            scenario_info.get('CollisionMatrix', {})),
+                        spawnables=spawnables, emitters=emitters)
@@ -1,46 +1,155 @@
+from math import cos, sin
+from threading import Lock
+from collections import namedtuple
 
-from pymunk import Circle, Poly
+from pymunk import Circle, Poly, ShapeFilter
 
-def __createCircleShape(info: 'Dict[str, Any]') -> 'Circle':
+ShapeBlueprint = namedtuple('ShapeBlueprint', ('shape_type', 'args', 'mass',
+                                               'elasticity', 'friction',
+                                               'shape_filter'))
 
-    shape = Circle(None, info['radius'],
-                   (info.get('x', 0), info.get('y', 0)))
+__MAX_COLLISION_CATEGORIES = 32
 
-    shape.mass = info['mass']
-    shape.elasticity = info.get('elasticity', 0.5)
-    shape.friction = info.get('friction', 0.5)
+# ALL_CATEGORIES and ALL_MASKS are methods since pymunk 6 and attributes
+# before, the default filter has them in every version
+__DEFAULT_SHAPE_FILTER = ShapeFilter()
 
-    return shape
+__collision_categories = {}
+__collision_categories_lock = Lock()
+
+def collisionCategories(names: 'Iterable[str]') -> int:
+    """Get the bits of named collision categories.
+
+    Each name gets its own bit the first time it is used, the same in every
+    model and scenario loaded by the process.
+    """
+
+    bits = 0
+
+    with __collision_categories_lock:
+        for name in names:
+            bit = __collision_categories.get(name)
+
+            if bit is None:
+                if len(__collision_categories) == __MAX_COLLISION_CATEGORIES:
+                    raise Exception('There can be at most '
+                                    f'{__MAX_COLLISION_CATEGORIES} collision '
+                                    'categories')
+
+                bit = 1 << len(__collision_categories)
+                __collision_categories[name] = bit
+
+            bits |= bit
+
+    return bits
 
-def __createPolyShape(info: 'Dict[str, Any]') -> 'Poly':
+def __compileShapeFilter(info: 'Dict[str, Any]') -> ShapeFilter:
+
+    categories = info.get('categories')
+    if categories is None:
+        categories = __DEFAULT_SHAPE_FILTER.categories
+    else:
+        categories = collisionCategories(categories)
+
+    mask = info.get('mask')
+    if mask is None:
+        mask = __DEFAULT_SHAPE_FILTER.mask
+    else:
+        mask = collisionCategories(mask)
+
+    return ShapeFilter(group=info.get('group', 0), categories=categories,
+                       mask=mask)
+
+def __circleShapeArgs(info: 'Dict[str, Any]') -> 'Tuple[Any, ...]':
+    return info['radius'], (info.get('x', 0), info.get('y', 0))
+
+def __polyShapeArgs(info: 'Dict[str, Any]') -> 'Tuple[Any, ...]':
 
     points = tuple((point.get('x', 0), point.get('y', 0))
                    for point in info['Point'])
-    shape = Poly(None, points)
 
-    shape.mass = info['mass']
-    shape.elasticity = info.get('elasticity', 0.5)
-    shape.friction = info.get('friction', 0.5)
+    return (points,)
 
-    return shape
+def __transformPoint(point, pose):
+
+    x, y, angle = pose
+    point_x, point_y = point
+    angle_cos = cos(angle)
+    angle_sin = sin(angle)
+
+    return (x + angle_cos*point_x - angle_sin*point_y,
+            y + angle_sin*point_x + angle_cos*point_y)
 
-__SHAPE_CREATE_FUNCTIONS = {
+def __circleTransformArgs(args, pose):
+    radius, offset = args
+    return radius, __transformPoint(offset, pose)
 
-    'circle': __createCircleShape,
-    'polygon': __createPolyShape
+def __polyTransformArgs(args, pose):
+    points, = args
+    return (tuple(__transformPoint(point, pose) for point in points),)
+
+__TRANSFORM_ARGS_FUNCTIONS = {
+
+    Circle: __circleTransformArgs,
+    Poly: __polyTransformArgs
+}
+
+__SHAPE_ARGS_FUNCTIONS = {
+
+    'circle': (Circle, __circleShapeArgs),
+    'polygon': (Poly, __polyShapeArgs)
 }
 
-def __createShape(info: 'Dict[str, Any]') -> 'Shape':
+def __compileShape(info: 'Dict[str, Any]') -> ShapeBlueprint:
 
     type_ = info.get('type')
 
-    create_func = __SHAPE_CREATE_FUNCTIONS.get(type_)
+    shape_type_and_args_func = __SHAPE_ARGS_FUNCTIONS.get(type_)
 
-    if create_func is None:
+    if shape_type_and_args_func is None:
         raise Exception(f'Invalid shape type \'{type_}\'')
 
-    return create_func(info)
+    shape_type, args_func = shape_type_and_args_func
+
+    return ShapeBlueprint(shape_type, args_func(info), info['mass'],
+                          info.get('elasticity', 0.5),
+                          info.get('friction', 0.5),
+                          __compileShapeFilter(info))
+
+def __buildShape(blueprint: ShapeBlueprint, body, pose) -> 'Shape':
+
+    args = blueprint.args
+    if pose is not None:
+        args = __TRANSFORM_ARGS_FUNCTIONS[blueprint.shape_type](args, pose)
+
+    shape = blueprint.shape_type(body, *args)
+
+    shape.mass = blueprint.mass
+    shape.elasticity = blueprint.elasticity
+    shape.friction = blueprint.friction
+    shape.filter = blueprint.shape_filter
+
+    return shape
+
+def compileShapes(info_list: 'Sequence[Dict[str, Any]]') \
+    -> 'Tuple[ShapeBlueprint, ...]':
+    return tuple(__compileShape(shape_info) for shape_info in info_list)
+
+def buildShapes(blueprints: 'Sequence[ShapeBlueprint]',
+                body: 'Optional[pymunk.Body]' = None,
+                pose: 'Optional[Tuple[float, float, float]]' = None) \
+    -> 'Tuple[Shape, ...]':
+    """Build shapes from their blueprints.
+
+    Args:
+        body: Body the shapes are attached to.
+        pose: Position and angle, in radians, the shapes are moved to, used
+            to attach shapes to a body that doesn't move with them, like the
+            static body of a space.
+    """
+
+    return tuple(__buildShape(blueprint, body, pose)
+                 for blueprint in blueprints)
 
 def loadShapes(info_list: 'Sequence[Dict[str, Any]]') -> 'Tuple[Shape, ...]':
-    return tuple(__createShape(shape_info)
-                 for shape_info in info_list)
+    return buildShapes(compileShapes(info_list))
@@ -1,4 +1,5 @@
 
+from math import pi
 from collections import namedtuple
 
 from pymunk import Body
@@ -8,6 +9,7 @@ from ...utils.errorgenerator import ErrorGenerator
 from ...devices.structure import Structure, StructuralPart
 from ...devices.sensors import PositionSensor, AngleSensor, SpeedSensor
 from ...devices.engine import LimitedLinearEngine
+from ...devices.launcher import Launcher
 from ...devices.interfacedevice import (
     TextDisplayDevice, ButtonDevice, KeyboardReceiverDevice, ConsoleDevice
 )
@@ -15,10 +17,19 @@ from ...devices.communicationdevices import (
     BasicReceiver, BasicSender, ConfigurableReceiver, ConfigurableSender
 )
 
-from .shapeloader import loadShapes
+from ..configfileinheritance import resolvePrefix
+
+from .shapeloader import compileShapes, buildShapes
 from .imageloader import loadImages
 
-ShipInfo = namedtuple('ShipInfo', ('device', 'images', 'widgets'))
+ShipInfo = namedtuple('ShipInfo', ('device', 'images', 'widgets',
+                                   'interface_devices'))
+
+ShipBlueprint = namedtuple('ShipBlueprint', ('shapes', 'mass', 'moment',
+                                             'parts', 'devices', 'images'))
+
+DeviceBlueprint = namedtuple('DeviceBlueprint', ('device_type', 'create_func',
+                                                 'info', 'part_name'))
 
 def __loadError(info: 'Dict[str, Any]') -> ErrorGenerator:
 
@@ -65,6 +76,14 @@ def __createLimitedLinearEngine(info: 'Dict[str, Any]', part: StructuralPart) \
                                                              1),
                                **__engineErrorKwargs(info)), ()
 
+def __createLauncher(info: 'Dict[str, Any]', part: StructuralPart) \
+    -> 'Tuple[Launcher, Sequence[QWidget]]':
+
+    return Launcher(part, info['object'], speed=info.get('speed', 0),
+                    angle=pi*info.get('angle', 0)/180,
+                    reload_time=info.get('reload_time', 0),
+                    lifetime=info.get('lifetime')), ()
+
 def __createPositionSensor(info: 'Dict[str, Any]', part: StructuralPart) \
     -> 'Tuple[PositionSensor, Sequence[QWidget]]':
 
@@ -174,6 +193,7 @@ def __createConfSender(info: 'Dict[str, Any]', part: StructuralPart,
 __DEVICE_CREATE_FUNCTIONS = {
 
     ('Actuator', 'engine', 'intensity_range'): __createLimitedLinearEngine,
+    ('Actuator', 'launcher', None): __createLauncher,
     ('Sensor', 'position', None): __createPositionSensor,
     ('Sensor', 'angle', None): __createAngleSensor,
     ('Sensor', 'speed', None): __createSpeedSensor,
@@ -188,16 +208,15 @@ __DEVICE_CREATE_FUNCTIONS = {
     ('Communication', 'sender', 'configurable'): __createConfSender
 }
 
-def __addDevice(
-        info: 'Dict[str, Any]', parts: 'Dict[str, StructuralPart]',
-        device_type: str, **kwargs) -> 'List[QWidget]':
+def __compileDevice(info: 'Dict[str, Any]', part_names: 'Set[str]',
+                    device_type: str, prefixes: 'Sequence[str]') \
+    -> DeviceBlueprint:
 
     type_and_model = (device_type, info.get('type'), info.get('model'))
     create_func = __DEVICE_CREATE_FUNCTIONS.get(type_and_model)
 
     part_name = info.get('part')
-    part = parts.get(part_name)
-    if part is None:
+    if part_name not in part_names:
         raise Exception(f"{device_type} has invalid part \'{part_name}\'.")
 
     if create_func is None:
@@ -205,60 +224,97 @@ def __addDevice(
         raise ValueError(
             f'Invalid type/model for {device_type} \'{type_and_model_str}\'.')
 
-    device, widgets = create_func(info, part, **kwargs)
+    # Object models used by devices are resolved like the scenario ones
+    object_model = info.get('object')
+    if object_model is not None:
+        info = dict(info, object=resolvePrefix(object_model, prefixes)[0])
 
-    part.addDevice(device, name=info.get('name'))
+    return DeviceBlueprint(device_type, create_func, info, part_name)
 
-    return widgets
+def launcherModels(blueprint: ShipBlueprint) -> 'Set[str]':
+    """Object models that the ships of a model may launch."""
 
-def __loadShipStructure(ship_info, name, space, body):
+    return {info['object'] for _, _, info, _ in blueprint.devices
+            if 'object' in info}
 
-    ship = Structure(name, space, body, device_type='ship')
+def compileShip(ship_info: 'Dict[str, Any]',
+                prefixes: 'Sequence[str]' = ()) -> ShipBlueprint:
+    """Process a ship model content so ships can be built from it quickly.
 
-    parts = {}
-    for part_info in ship_info.get('Part', ()):
-        part_name = part_info['name']
-        part = StructuralPart(offset=(part_info['x'], part_info['y']))
+    Everything that is the same for every ship of a model is done here, the
+    devices themselves are created by `buildShip`, so each ship still has its
+    own random errors.
+    """
 
-        ship.addDevice(part, name=part_name)
-        parts[part_name] = part
+    shapes = compileShapes(ship_info['Shape'])
 
-    return ship, parts
+    # Shapes are created once to get the mass and moment pymunk computes
+    prototype_shapes = buildShapes(shapes)
+    mass = sum(shape.mass for shape in prototype_shapes)
+    moment = sum(shape.moment for shape in prototype_shapes)
 
-def loadShip(ship_info: str, name: str, space: 'pymunk.Space',
-             prefixes: 'Sequence[str]' = (), communication_engine=None) \
-    -> 'Tuple[Structure, Sequence[QWidget]]':
+    parts = tuple((part_info['name'], (part_info['x'], part_info['y']))
+                  for part_info in ship_info.get('Part', ()))
+    part_names = {part_name for part_name, _ in parts}
+
+    devices = tuple(
+        __compileDevice(info, part_names, device_type, prefixes)
+        for device_type in ('Actuator', 'Sensor', 'Communication',
+                            'InterfaceDevice')
+        for info in ship_info.get(device_type, ()))
 
-    shapes = loadShapes(ship_info['Shape'])
+    return ShipBlueprint(shapes=shapes, mass=mass, moment=moment, parts=parts,
+                         devices=devices,
+                         images=tuple(loadImages(ship_info.get('Image', ()),
+                                                 prefixes=prefixes)))
 
-    mass = sum(shape.mass for shape in shapes)
-    moment = sum(shape.moment for shape in shapes)
+def buildShip(blueprint: ShipBlueprint, name: str, space: 'pymunk.Space',
+              communication_engine=None) -> ShipInfo:
 
-    if mass <= 0:
+    if blueprint.mass <= 0:
         raise Exception(f"Ship \'{name}\' has invalid mass")
 
-    body = Body(mass, moment)
+    body = Body(blueprint.mass, blueprint.moment)
 
+    shapes = buildShapes(blueprint.shapes)
     for shape in shapes:
         shape.body = body
 
     space.add(body, shapes)
 
-    ship, parts = __loadShipStructure(ship_info, name, space, body)
-
-    for info in ship_info.get('Actuator', ()):
-        __addDevice(info, parts, 'Actuator')
+    ship = Structure(name, space, body, device_type='ship')
 
-    for info in ship_info.get('Sensor', ()):
-        __addDevice(info, parts, 'Sensor')
+    parts = {}
+    for part_name, offset in blueprint.parts:
+        part = StructuralPart(offset=offset)
 
-    for info in ship_info.get('Communication', ()):
-        __addDevice(info, parts, 'Communication', engine=communication_engine)
+        ship.addDevice(part, name=part_name)
+        parts[part_name] = part
 
     widgets = []
-    for info in ship_info.get('InterfaceDevice', ()):
-        widgets.extend(
-            __addDevice(info, parts, 'InterfaceDevice'))
+    interface_devices = []
+    for device_type, create_func, info, part_name in blueprint.devices:
+
+        part = parts[part_name]
+
+        if device_type == 'Communication':
+            device, device_widgets = create_func(info, part,
+                                                 engine=communication_engine)
+        else:
+            device, device_widgets = create_func(info, part)
+
+        part.addDevice(device, name=info.get('name'))
+
+        if device_type == 'InterfaceDevice':
+            interface_devices.append(device)
+            widgets.extend(device_widgets)
+
+    return ShipInfo(device=ship, images=blueprint.images, widgets=widgets,
+                    interface_devices=interface_devices)
+
+def loadShip(ship_info: 'Dict[str, Any]', name: str, space: 'pymunk.Space',
+             prefixes: 'Sequence[str]' = (), communication_engine=None) \
+    -> ShipInfo:
 
-    return ShipInfo(device=ship, images=loadImages(
-        ship_info.get('Image', ()), prefixes=prefixes), widgets=widgets)
+    return buildShip(compileShip(ship_info, prefixes=prefixes), name, space,
+                     communication_engine=communication_engine)
@@ -0,0 +1,101 @@
+import os
+import pickle
+import tempfile
+
+from .contentcache import ContentCache
+from .fileimport import fileHash
+
+BUNDLE_VERSION = 1
+
+def saveBundle(path: 'pathlib.Path',
+               entries: 'Sequence[Tuple[Hashable, Tuple, bytes]]') -> None:
+    """Save exported cache entries of a scenario into a bundle file.
+
+    The hash of every file used by the entries is saved too, so entries whose
+    files were only touched are still considered up to date.
+    """
+
+    hashes = {dep_path: fileHash(dep_path)
+              for _, dependencies, _ in entries
+              for dep_path, stamp in dependencies if stamp is not None}
+
+    bundle = {
+        'version': BUNDLE_VERSION,
+        'entries': list(entries),
+        'hashes': hashes
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=str(path.parent))
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            pickle.dump(bundle, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, str(path))
+    except Exception:
+        os.unlink(temp_path)
+        raise
+
+def __updateDependencies(dependencies, hashes):
+
+    updated_dependencies = []
+    for dep_path, stamp in dependencies:
+
+        # Files that were missing when the bundle was made must still be
+        if stamp is None:
+            if os.path.exists(dep_path):
+                return None
+            updated_dependencies.append((dep_path, stamp))
+            continue
+
+        current_stamp = ContentCache.fileStamp(dep_path)
+
+        if current_stamp != stamp:
+            if fileHash(dep_path) != hashes.get(dep_path):
+                return None
+            stamp = current_stamp
+
+        updated_dependencies.append((dep_path, stamp))
+
+    return tuple(updated_dependencies)
+
+def loadBundle(path: 'pathlib.Path') \
+    -> 'Optional[List[Tuple[Hashable, Tuple, bytes]]]':
+    """Load the entries of a bundle that are still up to date.
+
+    Returns:
+        The entries whose files didn't change or None if the bundle doesn't
+        exist, is corrupt or was made by an incompatible version, so the
+        scenario is loaded from its files.
+    """
+
+    # A bundle truncated or written by another version of the program may
+    # fail to unpickle in many ways
+    try:
+        with open(path, 'rb') as file:
+            bundle = pickle.load(file)
+
+        if bundle.get('version') != BUNDLE_VERSION:
+            return None
+
+        hashes = dict(bundle['hashes'])
+        bundle_entries = [(key, tuple(dependencies), data)
+                          for key, dependencies, data in bundle['entries']]
+
+    except (FileNotFoundError, pickle.UnpicklingError, EOFError,
+            AttributeError, ImportError, IndexError, KeyError, TypeError,
+            ValueError):
+        return None
+
+    entries = []
+    for key, dependencies, data in bundle_entries:
+
+        try:
+            dependencies = __updateDependencies(dependencies, hashes)
+        except FileNotFoundError:
+            continue
+
+        if dependencies is not None:
+            entries.append((key, dependencies, data))
+
+    return entries